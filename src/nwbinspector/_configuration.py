@@ -1,7 +1,9 @@
 """Primary functions for inspecting NWBFiles."""
 
+import copy
 import json
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from types import FunctionType
 from typing import Optional, Union
@@ -11,17 +13,34 @@ import yaml
 
 from ._registration import Importance, available_checks
 
+try:  # The C-accelerated loader is only available if PyYAML was built against libyaml
+    from yaml import CSafeLoader as _YAML_SAFE_LOADER
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YAML_SAFE_LOADER  # type: ignore
+
 INTERNAL_CONFIGS: dict[str, Path] = dict(
     dandi=Path(__file__).parent / "_internal_configs" / "dandi.inspector_config.yaml",
 )
+CONFIG_SCHEMA_FILE_PATH = Path(__file__).parent / "_internal_configs" / "config.schema.json"
+
+
+@lru_cache(maxsize=1)
+def _get_config_validator() -> "jsonschema.protocols.Validator":
+    """Load the official schema and construct its validator only once per session."""
+    with open(file=CONFIG_SCHEMA_FILE_PATH, mode="r") as fp:
+        schema = json.load(fp=fp)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+
+    return validator_class(schema)
 
 
 def validate_config(config: dict) -> None:
     """Validate an instance of configuration against the official schema."""
-    config_schema_file_path = Path(__file__).parent / "_internal_configs" / "config.schema.json"
-    with open(file=config_schema_file_path, mode="r") as fp:
-        schema = json.load(fp=fp)
-    jsonschema.validate(instance=config, schema=schema)
+    # Equivalent to `jsonschema.validate`, which would otherwise reconstruct the validator on every call
+    error = jsonschema.exceptions.best_match(_get_config_validator().iter_errors(instance=config))
+    if error is not None:
+        raise error
 
 
 def _copy_function(function: Callable) -> Callable:
@@ -59,9 +78,18 @@ def load_config(filepath_or_keyword: Union[str, Path]) -> dict:
         - 'dandi'
             For all DANDI archive related practices, including validation and upload.
     """
-    file = INTERNAL_CONFIGS.get(str(filepath_or_keyword), filepath_or_keyword)
-    with open(file=file, mode="r") as stream:
-        config = yaml.safe_load(stream=stream)
+    file = Path(INTERNAL_CONFIGS.get(str(filepath_or_keyword), filepath_or_keyword)).resolve()
+    config = _load_yaml_file(file_path=file, modification_time=file.stat().st_mtime_ns)
+
+    # Copy so that callers may safely modify the result without affecting the cache
+    return copy.deepcopy(config)
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_file(file_path: Path, modification_time: int) -> dict:
+    """Parse a YAML file; the modification time is only part of the key so that edits to the file invalidate it."""
+    with open(file=file_path, mode="r") as stream:
+        config = yaml.load(stream=stream, Loader=_YAML_SAFE_LOADER)
 
     return config
 
@@ -111,16 +139,25 @@ def configure_checks(
             "from [CRITICAL_IMPORTANCE, BEST_PRACTICE_VIOLATION, BEST_PRACTICE_SUGGESTION]."
         )
 
+    # Sets make the name filtering below linear in the number of checks
+    ignore_names = set(ignore or [])
+    select_names = set(select or [])
+
     checks_out: list = []
     if config is not None:
         validate_config(config=config)
-        ignore = ignore or []
+        configured_check_names = set().union(*config.values())
         for check in checks:
+            # Only checks mentioned by the config need to be copied; the rest pass through unchanged
+            if check.__name__ not in configured_check_names:
+                checks_out.append(check)
+                continue
+
             mapped_check = copy_check(check=check)
             for importance_name, func_names in config.items():
                 if check.__name__ in func_names:
                     if importance_name == "SKIP":
-                        ignore.append(check.__name__)
+                        ignore_names.add(check.__name__)
                         continue
                     mapped_check.importance = Importance[importance_name]  # type: ignore
                     # Output wrappers are apparently parsed at time of wrapping not of time of output return...
@@ -131,12 +168,55 @@ def configure_checks(
                     # mapped_check.__wrapped__ = new_check_wrapper
             checks_out.append(mapped_check)
     else:
-        checks_out = checks
-    if select:
-        checks_out = [x for x in checks_out if x.__name__ in select]
-    elif ignore:
-        checks_out = [x for x in checks_out if x.__name__ not in ignore]
-    if importance_threshold:
-        checks_out = [x for x in checks_out if x.importance.value >= importance_threshold.value]  # type: ignore
+        checks_out = list(checks)  # Never hand back the registry itself
+    if select_names:
+        checks_out = [x for x in checks_out if x.__name__ in select_names]
+    elif ignore_names:
+        checks_out = [x for x in checks_out if x.__name__ not in ignore_names]
+    # Nothing is below the lowest level, so only filter (resolving the threshold value once) for higher thresholds
+    if importance_threshold and importance_threshold is not Importance.BEST_PRACTICE_SUGGESTION:
+        threshold_value = importance_threshold.value
+        checks_out = [x for x in checks_out if x.importance.value >= threshold_value]  # type: ignore
 
     return checks_out
+
+
+def _cached_configure_checks(
+    checks: Optional[list] = None,
+    config: Optional[dict] = None,
+    ignore: Optional[list[str]] = None,
+    select: Optional[list[str]] = None,
+    importance_threshold: Importance = Importance.BEST_PRACTICE_SUGGESTION,
+) -> tuple:
+    """
+    Memoized form of `configure_checks`, for repeated calls with the same options (such as once per file).
+
+    Returns an immutable tuple since the same result is shared by all callers.
+    """
+    return _configure_checks_from_key(
+        checks=tuple(checks or available_checks),
+        config_key=json.dumps(config, sort_keys=True) if config is not None else None,
+        ignore=tuple(ignore) if ignore is not None else None,
+        select=tuple(select) if select is not None else None,
+        importance_threshold=importance_threshold,
+    )
+
+
+@lru_cache(maxsize=32)
+def _configure_checks_from_key(
+    checks: tuple,
+    config_key: Optional[str],
+    ignore: Optional[tuple[str, ...]],
+    select: Optional[tuple[str, ...]],
+    importance_threshold: Importance,
+) -> tuple:
+    """Hashable-argument counterpart of `configure_checks`; the config is passed as its sorted JSON serialization."""
+    checks_out = configure_checks(
+        checks=list(checks),
+        config=json.loads(config_key) if config_key is not None else None,
+        ignore=list(ignore) if ignore is not None else None,
+        select=list(select) if select is not None else None,
+        importance_threshold=importance_threshold,
+    )
+
+    return tuple(checks_out)
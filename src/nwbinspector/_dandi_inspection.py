@@ -2,12 +2,12 @@ import pathlib
 from typing import Iterable, Literal, Union
 from warnings import filterwarnings
 
-import h5py
 import pynwb
 
 from ._configuration import load_config, validate_config
 from ._nwb_inspection import inspect_nwbfile_object
 from ._types import Importance, InspectorMessage
+from .tools._read_nwbfile import _open_hdf5_file
 
 
 def inspect_dandiset(
@@ -233,7 +233,7 @@ def inspect_url(
 
     byte_stream = remfile.File(url=url)
     with (
-        h5py.File(name=byte_stream) as file,
+        _open_hdf5_file(name=byte_stream) as file,
         pynwb.NWBHDF5IO(file=file) as io,
     ):
         if skip_validate is False:
@@ -3,19 +3,22 @@
 import json
 import os
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 from platform import platform
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Iterator, Optional, Union
 
 import numpy as np
 from packaging.version import Version
 
-from ._organization import organize_messages
+from ._organization import _organize_partitioned_messages
 from ._types import Importance, InspectorMessage
-from .utils import get_package_version
+from .utils import get_package_version, is_module_installed
+
+_MESSAGE_ATTRIBUTES = frozenset(InspectorMessage.__annotations__)
 
 
 class InspectorOutputJSONEncoder(json.JSONEncoder):
@@ -32,6 +35,45 @@ class InspectorOutputJSONEncoder(json.JSONEncoder):
             return super().default(o)
 
 
+def _orjson_default(o: object) -> Any:
+    """Equivalent of the InspectorOutputJSONEncoder for orjson, which would otherwise serialize Enums by value."""
+    if isinstance(o, InspectorMessage):
+        return {key: value.name if isinstance(value, Enum) else value for key, value in o.__dict__.items()}
+    if isinstance(o, Version):
+        return str(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _iter_save_json_report(
+    json_file_path: Union[str, Path], header: dict, messages: Iterable[Union[InspectorMessage, None]]
+) -> Iterator[Union[InspectorMessage, None]]:
+    """
+    Write each message to a JSON report as it is produced, then pass it along to the caller.
+
+    The report is only complete once the returned iterator is exhausted.
+    Uses the faster `orjson` package for serialization if it is installed.
+    """
+    if is_module_installed(module_name="orjson"):
+        import orjson
+
+        def dumps(obj: object) -> bytes:
+            return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    else:
+
+        def dumps(obj: object) -> bytes:
+            return json.dumps(obj=obj, cls=InspectorOutputJSONEncoder).encode()
+
+    with open(file=json_file_path, mode="wb") as fp:
+        fp.write(b'{"header": ' + dumps(header) + b', "messages": [')
+        separator = b""
+        for message in messages:
+            fp.write(separator + dumps(message))
+            separator = b", "
+            yield message
+        fp.write(b"]}")
+
+
 def _get_report_header() -> dict[str, str]:
     """Grab basic information from system at time of report generation."""
     return dict(
@@ -83,16 +125,29 @@ class MessageFormatter:
         formatter_options: Optional[FormatterOptions] = None,
     ) -> None:
         self.nmessages = len(messages)
-        self.nfiles = len(set(message.file_path for message in messages))  # type: ignore
-        self.message_count_by_importance = self._count_messages_by_importance(messages=messages)
-        self.initial_organized_messages = organize_messages(messages=messages, levels=levels, reverse=reverse)
+
+        # Collect the file paths, importance counts, and first level of organization in a single pass
+        file_paths = set()
+        importance_counts: Counter = Counter()
+        partitioned_messages = defaultdict(list)
+        first_level = levels[0]
+        for message in messages:
+            file_paths.add(message.file_path)  # type: ignore
+            importance_counts[message.importance.name] += 1  # type: ignore
+            partitioned_messages[getattr(message, first_level)].append(message)
+        self.nfiles = len(file_paths)
+        self.message_count_by_importance = self._order_importance_counts(importance_counts=importance_counts)
+        self.initial_organized_messages = _organize_partitioned_messages(
+            partitioned_messages=partitioned_messages, levels=levels, reverse=reverse
+        )
         self.detailed = detailed
         self.levels = levels
         self.nlevels = len(levels)
-        self.free_levels = (
-            set([x for x in InspectorMessage.__annotations__]) - set(levels) - set(["message", "severity"])
-        )
-        self.collection_levels = set([x for x in InspectorMessage.__annotations__]) - set(levels) - set(["severity"])
+        levels_set = frozenset(levels)
+        self.free_levels = _MESSAGE_ATTRIBUTES - levels_set - {"message", "severity"}
+        self.collection_levels = _MESSAGE_ATTRIBUTES - levels_set - {"severity"}
+        # 'message' and 'object_name' can never be levels, so this getter always returns a tuple
+        self._collection_getter = attrgetter(*sorted(self.collection_levels))
         self.reverse = reverse
         if formatter_options is None:
             self.formatter_options = FormatterOptions()
@@ -101,27 +156,26 @@ class MessageFormatter:
                 formatter_options, FormatterOptions
             ), "'formatter_options' is not an instance of FormatterOptions!"
             self.formatter_options = formatter_options
-        self.formatter_options.section_headers = self.formatter_options.section_headers + (
-            self.formatter_options.section_headers[-1],
-        ) * (self.nlevels - len(self.formatter_options.section_headers))
+        # Pad a copy rather than the options themselves, which may be shared across formatters
+        section_headers = self.formatter_options.section_headers
+        self.section_headers = tuple(section_headers) + (section_headers[-1],) * max(
+            0, self.nlevels - len(section_headers)
+        )
         self.message_counter = 0
         self.formatted_messages: list = []
 
     @staticmethod
-    def _count_messages_by_importance(messages: list[Optional[InspectorMessage]]) -> dict[str, int]:
-        message_count_by_importance = {importance_level.name: 0 for importance_level in Importance}
-        for message in messages:
-            message_count_by_importance[message.importance.name] += 1  # type: ignore
-        for key in [keys for keys, count in message_count_by_importance.items() if count == 0]:
-            message_count_by_importance.pop(key)
-        return message_count_by_importance
+    def _order_importance_counts(importance_counts: Counter) -> dict[str, int]:
+        """Order the number of messages of each importance level from most to least important."""
+        return {
+            importance_level.name: importance_counts[importance_level.name]
+            for importance_level in Importance
+            if importance_level.name in importance_counts
+        }
 
     @staticmethod
     def _get_name(obj: Union[Enum, str]) -> str:
-        if isinstance(obj, Enum):
-            return obj.name
-        if isinstance(obj, str):
-            return obj
+        return obj.name if isinstance(obj, Enum) else obj
 
     def _get_message_header(self, message: InspectorMessage) -> str:
         message_header = ""
@@ -131,7 +185,7 @@ class MessageFormatter:
             message_header += f"{message.check_function_name} - "
         if "importance" in self.free_levels:
             message_header += f"Importance level '{message.importance.name}' - "
-        if any((x in self.free_levels for x in ["object_type", "object_name"])):
+        if any(x in self.free_levels for x in ["object_type", "object_name"]):
             message_header += f"'{message.object_type}' object "
         if "location" in self.free_levels and message.location:
             message_header += f"at location '{message.location}'"
@@ -144,76 +198,98 @@ class MessageFormatter:
             f"{'.'.join(np.array(level_counter, dtype=str))}.{self.message_counter}" f"{self.formatter_options.indent}"
         )
 
-    def _add_subsection(
+    def _iter_subsection(
         self,
         organized_messages: dict,
         levels: list[str],
         level_counter: list[int],
-    ) -> None:
-        """Recursive helper for display_messages."""
-        this_level_counter = list(level_counter)  # local copy passed from previous recursion level
-        if len(levels) > 1:
-            this_level_counter.append(0)
-            for i, (key, val) in enumerate(organized_messages.items()):  # Add section header and recurse
-                this_level_counter[-1] = i
-                increment = f"{'.'.join(np.array(this_level_counter, dtype=str))}{self.formatter_options.indent}"
+    ) -> Iterator[str]:
+        """
+        Iterative helper for display_messages that yields each line of the report sections as it is formatted.
+
+        Traverses the organized messages depth-first using an explicit stack instead of recursion.
+        Each entry of the stack is (has_header, key, organized_messages, levels, level_counter); subsections are
+        pushed in reverse order so they are popped, and hence displayed, in their original order.
+        """
+        indent = self.formatter_options.indent
+        section_headers = self.section_headers
+        stack: list[tuple[bool, Any, dict, list[str], list[int]]] = [
+            (False, None, organized_messages, levels, list(level_counter))
+        ]
+        while stack:
+            has_header, key, this_organized_messages, these_levels, this_level_counter = stack.pop()
+            if has_header:  # Add section header before the contents of the subsection
+                increment = f"{'.'.join(np.array(this_level_counter, dtype=str))}{indent}"
                 section_name = f"{increment}{self._get_name(obj=key)}"
-                self.formatted_messages.append(section_name)
-                self.formatted_messages.extend(
-                    [f"{self.formatter_options.section_headers[len(this_level_counter) - 1]}" * len(section_name), ""]
-                )
-                self._add_subsection(organized_messages=val, levels=levels[1:], level_counter=this_level_counter)
-        else:  # Final section, display message information
-            if levels[0] == "file_path" and not self.detailed:
+                yield section_name
+                yield f"{section_headers[len(this_level_counter) - 1]}" * len(section_name)
+                yield ""
+
+            if len(these_levels) > 1:
+                subsections = list(enumerate(this_organized_messages.items()))
+                for i, (sub_key, sub_val) in reversed(subsections):
+                    stack.append((True, sub_key, sub_val, these_levels[1:], this_level_counter + [i]))
+            elif these_levels[0] == "file_path" and not self.detailed:  # Final section, display message information
                 # Collect messages into unique parts based on available submessage information in the
                 # 'free_levels' plus 'message' and 'object_name'
-                binned_messages = defaultdict(list)
-                for file_path, messages in organized_messages.items():
+                # Only the first message of each bin is displayed, so the rest need only be counted
+                binned_messages: dict[tuple, list] = dict()
+                for file_path, messages in this_organized_messages.items():
                     for message in messages:
-                        submessage = tuple([getattr(message, attr) for attr in self.collection_levels])
-                        binned_messages[submessage].append(message)
+                        submessage = self._collection_getter(message)
+                        binned_message = binned_messages.get(submessage)
+                        if binned_message is None:
+                            binned_messages[submessage] = [message, 1]
+                        else:
+                            binned_message[1] += 1
                 # Display only the unique messages and first 'file_path' + counter for each
-                for same_messages in binned_messages.values():
-                    message = same_messages[0]
+                for message, num_same in binned_messages.values():
                     increment = self._get_message_increment(level_counter=this_level_counter)
                     message_header = self._get_message_header(message=message)
-                    num_same = len(same_messages)
                     file_or_files = "s" if num_same > 2 else ""
                     additional_file_str = f" and {num_same-1} other file{file_or_files}" if num_same > 1 else ""
-                    self.formatted_messages.append(
-                        f"{increment}{message.file_path}{additional_file_str}: " f"{message_header.rstrip(' - ')}"
-                    )
-                    self.formatted_messages.extend([f"{' ' * len(increment)}  Message: {message.message}", ""])
+                    yield f"{increment}{message.file_path}{additional_file_str}: " f"{message_header.rstrip(' - ')}"
+                    yield f"{' ' * len(increment)}  Message: {message.message}"
+                    yield ""
                     self.message_counter += 1
             else:
-                for key, val in organized_messages.items():
+                for leaf_key, val in this_organized_messages.items():
                     for message in val:
                         increment = self._get_message_increment(level_counter=this_level_counter)
                         message_header = self._get_message_header(message=message)
-                        self.formatted_messages.append(f"{increment}{key}: {message_header.rstrip(' - ')}")
-                        self.formatted_messages.extend([f"{' ' * len(increment)}  Message: {message.message}", ""])
+                        yield f"{increment}{leaf_key}: {message_header.rstrip(' - ')}"
+                        yield f"{' ' * len(increment)}  Message: {message.message}"
+                        yield ""
                         self.message_counter += 1
 
-    def format_messages(self) -> list[str]:
-        """Deploy recursive addition of sections, terminating with message display."""
+    def format_messages_iter(self) -> Iterator[str]:
+        """
+        Lazily generate each line of the report, starting with the summary header.
+
+        Allows large reports to be consumed (e.g., written to a file) without holding every line in memory.
+        """
         report_header = _get_report_header()
-        self.formatted_messages.extend(
-            [
-                "*" * 50,
-                "NWBInspector Report Summary",
-                "",
-                f"Timestamp: {report_header['Timestamp']}",
-                f"Platform: {report_header['Platform']}",
-                f"NWBInspector version: {report_header['NWBInspector_version']}",
-                "",
-                f"Found {self.nmessages} issues over {self.nfiles} files:",
-            ]
-        )
+        yield "*" * 50
+        yield "NWBInspector Report Summary"
+        yield ""
+        yield f"Timestamp: {report_header['Timestamp']}"
+        yield f"Platform: {report_header['Platform']}"
+        yield f"NWBInspector version: {report_header['NWBInspector_version']}"
+        yield ""
+        yield f"Found {self.nmessages} issues over {self.nfiles} files:"
         for importance_level, number_of_results in self.message_count_by_importance.items():
             increment = " " * (8 - len(str(number_of_results)))
-            self.formatted_messages.append(f"{increment}{number_of_results} - {importance_level}")
-        self.formatted_messages.extend(["*" * 50, "", ""])
-        self._add_subsection(organized_messages=self.initial_organized_messages, levels=self.levels, level_counter=[])
+            yield f"{increment}{number_of_results} - {importance_level}"
+        yield "*" * 50
+        yield ""
+        yield ""
+        yield from self._iter_subsection(
+            organized_messages=self.initial_organized_messages, levels=self.levels, level_counter=[]
+        )
+
+    def format_messages(self) -> list[str]:
+        """Deploy iterative addition of sections, terminating with message display."""
+        self.formatted_messages.extend(self.format_messages_iter())
         return self.formatted_messages
 
 
@@ -234,22 +310,27 @@ def format_messages(
 
 def print_to_console(formatted_messages: list[str]) -> None:
     """Print report file contents to console."""
-    sys.stdout.write(os.linesep * 2)
-    for line in formatted_messages:
-        sys.stdout.write(line + "\n")
+    sys.stdout.write(os.linesep * 2 + "\n".join([*formatted_messages, ""]))
 
     return None
 
 
-def save_report(report_file_path: Union[str, Path], formatted_messages: list[str], overwrite: bool = False) -> None:
-    """Write the list of organized check results to a nicely formatted text file."""
+def save_report(report_file_path: Union[str, Path], formatted_messages: Iterable[str], overwrite: bool = False) -> None:
+    """
+    Write the organized check results to a nicely formatted text file.
+
+    The formatted messages may also be an iterator, such as from `MessageFormatter.format_messages_iter`, in which
+    case the lines are written to the file as they are generated.
+    """
     report_file_path = Path(report_file_path)
 
     if report_file_path.exists() and not overwrite:
         raise FileExistsError(f"The file {report_file_path} already exists! Set 'overwrite=True' or pass '-o' flag.")
 
     with open(file=report_file_path, mode="w", newline="\n") as file:
-        for line in formatted_messages:
-            file.write(line + "\n")
+        if isinstance(formatted_messages, list):
+            file.write("\n".join([*formatted_messages, ""]))
+        else:
+            file.writelines(f"{line}\n" for line in formatted_messages)
 
     return None
@@ -3,23 +3,26 @@
 import importlib
 import traceback
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, Optional, Type, Union
+from typing import Generator, Iterable, Optional, Type, Union
 from warnings import filterwarnings, warn
 
 import pynwb
+from hdmf.backends.io import HDMFIO
+from hdmf.validate import ValidatorMap
 from natsort import natsorted
 from tqdm import tqdm
 
-from ._configuration import configure_checks
+from ._configuration import _cached_configure_checks, configure_checks
 from ._registration import Importance, InspectorMessage, available_checks
-from .tools._read_nwbfile import read_nwbfile, read_nwbfile_and_io
+from .tools._read_nwbfile import read_nwbfile_and_io
 from .utils import (
     OptionalListOfStrings,
     PathType,
     calculate_number_of_cpu,
 )
+from .utils._utils import _get_available_cpu_count
 
 
 def inspect_all(
@@ -126,11 +129,14 @@ def inspect_all(
     if progress_bar_options is None:
         progress_bar_options = dict(position=0, leave=False)
 
+    nwbfiles: Iterable[Path]
     if in_path.is_dir():
-        nwbfiles = list(in_path.rglob("*.nwb*"))
-
         # Remove any macOS sidecar files
-        nwbfiles = [nwbfile for nwbfile in nwbfiles if not nwbfile.name.startswith("._")]
+        nwbfiles = (nwbfile for nwbfile in in_path.rglob("*.nwb*") if not nwbfile.name.startswith("._"))
+
+        # The directory is only walked up front when the total number of files is needed
+        if progress_bar or calculated_number_of_jobs != 1:
+            nwbfiles = list(nwbfiles)
     elif in_path.is_file():
         nwbfiles = [in_path]
     else:
@@ -138,79 +144,91 @@ def inspect_all(
     # Filtering of checks should apply after external modules are imported, in case those modules have their own checks
     checks = configure_checks(config=config, ignore=ignore, select=select, importance_threshold=importance_threshold)
 
-    # Manual identifier check over all files in the folder path
+    # Each file is only opened once; the identifier is collected while that file is being inspected
     identifiers = defaultdict(list)
-    for nwbfile_path in nwbfiles:
-        try:
-            nwbfile = read_nwbfile(nwbfile_path=nwbfile_path)
-            identifiers[nwbfile.identifier].append(nwbfile_path)
-        except Exception as exception:
-            yield InspectorMessage(
-                message=traceback.format_exc(),
-                importance=Importance.ERROR,
-                check_function_name=f"During io.read() - {type(exception)}: {str(exception)}",
-                file_path=str(nwbfile_path),
-            )
-
-    if len(identifiers) != len(nwbfiles):
-        for identifier, nwbfiles_with_identifier in identifiers.items():
-            if len(nwbfiles_with_identifier) > 1:
-                yield InspectorMessage(
-                    message=(
-                        f"The identifier '{identifier}' is used across the .nwb files: "
-                        f"{natsorted([x.name for x in nwbfiles_with_identifier])}. "
-                        "The identifier of any NWBFile should be a completely unique value - "
-                        "we recommend using uuid4 to achieve this."
-                    ),
-                    importance=Importance.CRITICAL,
-                    check_function_name="check_unique_identifiers",
-                    object_type="NWBFile",
-                    object_name="root",
-                    location="/",
-                    file_path=str(path),
-                )
-
     nwbfiles_iterable = nwbfiles
     if progress_bar:
         nwbfiles_iterable = progress_bar_class(nwbfiles_iterable, **progress_bar_options)
     if calculated_number_of_jobs == 1:
         for nwbfile_path in nwbfiles_iterable:  # type: ignore
-            for message in inspect_nwbfile(nwbfile_path=nwbfile_path, checks=checks, skip_validate=skip_validate):
-                yield message
+            identifier = yield from _inspect_nwbfile_helper(
+                nwbfile_path=nwbfile_path, checks=checks, skip_validate=skip_validate
+            )
+            if identifier is not None:
+                identifiers[identifier].append(nwbfile_path)
     else:
-        progress_bar_options.update(total=len(nwbfiles))
-        futures = []
+        progress_bar_options.update(total=len(nwbfiles))  # type: ignore
         # concurrents uses None instead of -1 for 'auto' mode
         max_workers = None if calculated_number_of_jobs == -1 else calculated_number_of_jobs
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            for nwbfile_path in nwbfiles:
-                futures.append(
-                    executor.submit(
-                        _pickle_inspect_nwb,
-                        nwbfile_path=str(nwbfile_path),
-                        checks=checks,
-                        skip_validate=skip_validate,
-                    )
-                )
-            async_nwbfiles_iterable = as_completed(futures)
+        # Each worker has to import the full stack on startup, so never start more workers than there are files
+        max_workers = min(max_workers or _get_available_cpu_count(), max(1, len(nwbfiles)))  # type: ignore
+        # The checks are sent once to each worker on initialization, rather than pickled along with every file path;
+        # file paths are also submitted in batches to reduce the number of round trips to the workers
+        chunksize = max(1, len(nwbfiles) // (max_workers * 4))  # type: ignore
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_initialize_worker, initargs=(checks, skip_validate)
+        ) as executor:
+            results = executor.map(
+                _pickle_inspect_nwb_in_worker, [str(nwbfile_path) for nwbfile_path in nwbfiles], chunksize=chunksize
+            )
             if progress_bar:
-                async_nwbfiles_iterable = progress_bar_class(async_nwbfiles_iterable, **progress_bar_options)
-            for future in async_nwbfiles_iterable:
-                for message in future.result():
-                    if stream:
-                        message.file_path = nwbfiles[message.file_path]
+                results = progress_bar_class(results, **progress_bar_options)
+            for nwbfile_path, (identifier, messages) in zip(nwbfiles, results):
+                if identifier is not None:
+                    identifiers[identifier].append(nwbfile_path)
+                for message in messages:
                     yield message
 
+    for identifier, nwbfiles_with_identifier in identifiers.items():
+        if len(nwbfiles_with_identifier) > 1:
+            yield InspectorMessage(
+                message=(
+                    f"The identifier '{identifier}' is used across the .nwb files: "
+                    f"{natsorted([x.name for x in nwbfiles_with_identifier])}. "
+                    "The identifier of any NWBFile should be a completely unique value - "
+                    "we recommend using uuid4 to achieve this."
+                ),
+                importance=Importance.CRITICAL,
+                check_function_name="check_unique_identifiers",
+                object_type="NWBFile",
+                object_name="root",
+                location="/",
+                file_path=str(path),
+            )
+
+
+_WORKER_INSPECTION_OPTIONS: dict = dict()
+
+
+def _initialize_worker(checks: list, skip_validate: bool) -> None:
+    """Store the inspection options on each worker process of the ProcessPoolExecutor used by inspect_all."""
+    _WORKER_INSPECTION_OPTIONS.update(checks=checks, skip_validate=skip_validate)
+
+
+def _pickle_inspect_nwb_in_worker(nwbfile_path: str) -> tuple[Optional[str], list[Union[InspectorMessage, None]]]:
+    """Auxiliary function for inspect_all to run in parallel on workers set up by `_initialize_worker`."""
+    return _pickle_inspect_nwb(nwbfile_path=nwbfile_path, **_WORKER_INSPECTION_OPTIONS)
+
 
 def _pickle_inspect_nwb(
     nwbfile_path: str,
     checks: Optional[list] = None,
     skip_validate: bool = False,
-) -> Iterable[Union[InspectorMessage, None]]:
-    """Auxiliary function for inspect_all to run in parallel using the ProcessPoolExecutor."""
+) -> tuple[Optional[str], list[Union[InspectorMessage, None]]]:
+    """
+    Auxiliary function for inspect_all to run in parallel using the ProcessPoolExecutor.
+
+    Returns the identifier of the file (None if it could not be read) along with the list of messages.
+    """
     checks = checks or available_checks
 
-    return list(inspect_nwbfile(nwbfile_path=nwbfile_path, checks=checks, skip_validate=skip_validate))
+    messages = list()
+    inspection = _inspect_nwbfile_helper(nwbfile_path=nwbfile_path, checks=checks, skip_validate=skip_validate)
+    while True:
+        try:
+            messages.append(next(inspection))
+        except StopIteration as stop:
+            return stop.value, messages
 
 
 def inspect_nwbfile(
@@ -266,15 +284,43 @@ def inspect_nwbfile(
         )
         raise ValueError(message)
 
+    yield from _inspect_nwbfile_helper(
+        nwbfile_path=nwbfile_path,
+        checks=checks,
+        skip_validate=skip_validate,
+        config=config,
+        ignore=ignore,
+        select=select,
+        importance_threshold=importance_threshold,
+    )
+
+
+def _inspect_nwbfile_helper(
+    nwbfile_path: Union[str, Path],
+    checks: list,
+    skip_validate: bool = False,
+    config: Optional[dict] = None,
+    ignore: OptionalListOfStrings = None,
+    select: OptionalListOfStrings = None,
+    importance_threshold: Union[str, Importance] = Importance.BEST_PRACTICE_SUGGESTION,
+) -> Generator[Union[InspectorMessage, None], None, Optional[str]]:
+    """
+    Open and inspect an NWB file, yielding each message.
+
+    Once exhausted, returns the identifier of the NWBFile (or None if it could not be read) so that `inspect_all` can
+    check for uniqueness of identifiers without having to open each file a second time.
+    """
     nwbfile_path = str(nwbfile_path)
     filterwarnings(action="ignore", message="No cached namespaces found in .*")
     filterwarnings(action="ignore", message="Ignoring cached namespace .*")
 
+    identifier = None
     try:
         in_memory_nwbfile, io = read_nwbfile_and_io(nwbfile_path=nwbfile_path)
+        identifier = in_memory_nwbfile.identifier
 
         if not skip_validate:
-            validation_errors = pynwb.validate(io=io)
+            validation_errors = _validate_io(io=io)
             for validation_error in validation_errors:
                 yield InspectorMessage(
                     message=validation_error.reason,
@@ -302,6 +348,25 @@ def inspect_nwbfile(
             file_path=nwbfile_path,
         )
 
+    return identifier
+
+
+_CORE_VALIDATOR_MAPS: dict[tuple[str, str], ValidatorMap] = dict()
+
+
+def _validate_io(io: HDMFIO) -> list:
+    """
+    Equivalent to `pynwb.validate(io=io)`, but reuses the validator built for each version of the core namespace.
+
+    Constructing the validator is far more expensive than the validation itself, and is otherwise repeated per file.
+    """
+    namespace = io.manager.namespace_catalog.get_namespace(name=pynwb.CORE_NAMESPACE)
+    validator_map_key = (namespace.name, namespace.version)
+    if validator_map_key not in _CORE_VALIDATOR_MAPS:
+        _CORE_VALIDATOR_MAPS[validator_map_key] = ValidatorMap(namespace)
+
+    return _CORE_VALIDATOR_MAPS[validator_map_key].validate(io.read_builder())
+
 
 # TODO: deprecate once subject types and dandi schemas have been extended
 def _intercept_in_vitro_protein(nwbfile_object: pynwb.NWBFile, checks: Optional[list] = None) -> list:
@@ -382,9 +447,19 @@ def inspect_nwbfile_object(
     importance_threshold = (
         Importance[importance_threshold] if isinstance(importance_threshold, str) else importance_threshold
     )
-    if any(argument is not None for argument in [config, ignore, select, importance_threshold]):
-        checks = configure_checks(
-            checks=checks, config=config, ignore=ignore, select=select, importance_threshold=importance_threshold
+    # The default threshold is the lowest level, so it filters nothing; checks configured upstream (as by
+    # `inspect_all`) are then used as-is instead of being reconfigured for every file
+    if (
+        config is not None
+        or ignore is not None
+        or select is not None
+        or importance_threshold not in (None, Importance.BEST_PRACTICE_SUGGESTION)
+    ):
+        # Memoized since this may be called once per file with the same options; the cached tuple is left unmodified
+        checks = list(
+            _cached_configure_checks(
+                checks=checks, config=config, ignore=ignore, select=select, importance_threshold=importance_threshold
+            )
         )
 
     subject_dependent_checks = _intercept_in_vitro_protein(nwbfile_object=nwbfile_object, checks=checks)
@@ -425,13 +500,18 @@ def run_checks(
     else:
         check_progress = checks
 
+    # Many checks share a neurodata_type, so only determine the objects applicable to each type once
+    nwbfile_objects = list(nwbfile.objects.values())
+    nwbfile_objects_by_neurodata_type: dict = {None: nwbfile_objects}
     for check_function in check_progress:
-        for nwbfile_object in nwbfile.objects.values():
-            if check_function.neurodata_type is not None and not issubclass(
-                type(nwbfile_object), check_function.neurodata_type
-            ):
-                continue
-
+        neurodata_type = check_function.neurodata_type
+        if neurodata_type not in nwbfile_objects_by_neurodata_type:
+            nwbfile_objects_by_neurodata_type[neurodata_type] = [
+                nwbfile_object for nwbfile_object in nwbfile_objects if issubclass(type(nwbfile_object), neurodata_type)
+            ]
+        check_importance = check_function.importance
+
+        for nwbfile_object in nwbfile_objects_by_neurodata_type[neurodata_type]:
             try:
                 output = check_function(nwbfile_object)
             # if an individual check fails, include it in the report and continue with the inspection
@@ -448,9 +528,9 @@ def run_checks(
             if isinstance(output, InspectorMessage):
                 # temporary solution to https://github.com/dandi/dandi-cli/issues/1031
                 if output.importance != Importance.ERROR:
-                    output.importance = check_function.importance
+                    output.importance = check_importance
                 yield output
             elif output is not None:
                 for x in output:
-                    x.importance = check_function.importance
+                    x.importance = check_importance
                     yield x
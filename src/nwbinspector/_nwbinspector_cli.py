@@ -2,7 +2,6 @@
 
 import importlib
 import importlib.metadata
-import json
 import os
 from pathlib import Path
 from typing import Union
@@ -12,8 +11,8 @@ import click
 from ._configuration import load_config
 from ._dandi_inspection import inspect_dandi_file_path, inspect_dandiset, inspect_url
 from ._formatting import (
-    InspectorOutputJSONEncoder,
     _get_report_header,
+    _iter_save_json_report,
     format_messages,
     print_to_console,
     save_report,
@@ -131,6 +130,9 @@ def _nwbinspector_cli(
     elif stream is True and config is None:
         config = "dandi"
 
+    if json_file_path is not None and Path(json_file_path).exists() and not overwrite:
+        raise FileExistsError(f"The file {json_file_path} already exists! Specify the '-o' flag to overwrite.")
+
     handled_config = config if config is None else load_config(filepath_or_keyword=config)
     handled_levels = ["importance", "file_path"] if levels is None else levels.split(",")
     handled_reverse = [False] * len(handled_levels) if reverse is None else [strtobool(x) for x in reverse.split(",")]
@@ -198,15 +200,15 @@ def _nwbinspector_cli(
             skip_validate=skip_validate,
             progress_bar=show_progress_bar,
         )
-    messages = list(messages_iterator)
 
     if json_file_path is not None:
-        if Path(json_file_path).exists() and not overwrite:
-            raise FileExistsError(f"The file {json_file_path} already exists! Specify the '-o' flag to overwrite.")
-        with open(file=json_file_path, mode="w") as fp:
-            json_report = dict(header=_get_report_header(), messages=messages)
-            json.dump(obj=json_report, fp=fp, cls=InspectorOutputJSONEncoder)
-            print(f"{os.linesep*2}Report saved to {str(Path(json_file_path).absolute())}!{os.linesep}")
+        # Messages are written to the JSON report as they are produced, rather than serializing them all at the end
+        messages_iterator = _iter_save_json_report(
+            json_file_path=json_file_path, header=_get_report_header(), messages=messages_iterator
+        )
+    messages = list(messages_iterator)
+    if json_file_path is not None:
+        print(f"{os.linesep*2}Report saved to {str(Path(json_file_path).absolute())}!{os.linesep}")
 
     formatted_messages = format_messages(
         messages=messages, levels=handled_levels, reverse=handled_reverse, detailed=detailed
@@ -1,19 +1,26 @@
 """Internally used tools specifically for rendering more human-readable output from collected check results."""
 
+from collections import defaultdict
 from enum import Enum
+from operator import attrgetter
 from typing import Optional
 
-from natsort import natsorted
+from natsort import natsort_keygen
 
 from ._registration import InspectorMessage
 
+# Constructing a natsort key function is relatively expensive compared to sorting the few unique values of a level
+_NATSORT_KEY = natsort_keygen()
+_ENUM_NATSORT_KEY = natsort_keygen(key=lambda x: -x.value)
+_SEVERITY_KEY = attrgetter("severity.value")
+
 
 def _sort_unique_values(unique_values: list, reverse: bool = False) -> list:
     """Technically, the 'set' method applies basic sorting to the unique contents, but natsort is more general."""
     if any(unique_values) and isinstance(unique_values[0], Enum):
-        return natsorted(unique_values, key=lambda x: -x.value, reverse=reverse)
+        return sorted(unique_values, key=_ENUM_NATSORT_KEY, reverse=reverse)
     else:
-        return natsorted(unique_values, reverse=reverse)
+        return sorted(unique_values, key=_NATSORT_KEY, reverse=reverse)
 
 
 def organize_messages(
@@ -34,28 +41,53 @@ def organize_messages(
         If provided, this should be a list of booleans that correspond to the 'levels' argument.
         If True, the values will be sorted in reverse order.
     """
-    assert all([x not in levels for x in ["message", "object_name", "severity"]]), (
+    partitioned_messages = _partition_messages(messages=messages, level=levels[0])
+
+    return _organize_partitioned_messages(partitioned_messages=partitioned_messages, levels=levels, reverse=reverse)
+
+
+def _partition_messages(messages: list[Optional[InspectorMessage]], level: str) -> dict:
+    """Bin the messages by their value of the given level, preserving their relative order."""
+    partitioned_messages = defaultdict(list)
+    for message in messages:
+        partitioned_messages[getattr(message, level)].append(message)
+
+    return partitioned_messages
+
+
+def _organize_partitioned_messages(
+    partitioned_messages: dict, levels: list[str], reverse: Optional[list[bool]] = None
+) -> dict:
+    """
+    Organize InspectorMessages which have already been partitioned by the value of their first level.
+
+    Allows callers that already iterate over all messages to collect the first level in the same pass.
+    """
+    assert all(x not in levels for x in ["message", "object_name", "severity"]), (
         "You must specify levels to organize by that correspond to attributes of the InspectorMessage class, excluding "
         "the text message, object_name, and severity."
     )
     if reverse is None:
         reverse = [False] * len(levels)
-    unique_values = list(set(getattr(message, levels[0]) for message in messages))
-    sorted_values = _sort_unique_values(unique_values, reverse=reverse[0])
-    if len(levels) > 1:
-        return {
-            value: organize_messages(
-                messages=[message for message in messages if getattr(message, levels[0]) == value],
-                levels=levels[1:],
-                reverse=reverse[1:],
-            )
-            for value in sorted_values
-        }
-    else:
+    last_depth = len(levels) - 1
+
+    # Recursion tracks the depth into 'levels' and 'reverse' rather than slicing new copies of them at each level
+    def _organize(partitioned_messages_at_depth: dict, depth: int) -> dict:
+        sorted_values = _sort_unique_values(list(partitioned_messages_at_depth), reverse=reverse[depth])
+        if depth == last_depth:
+            return {
+                value: sorted(partitioned_messages_at_depth[value], key=_SEVERITY_KEY, reverse=True)
+                for value in sorted_values
+            }
+
         return {
-            value: sorted(
-                [message for message in messages if getattr(message, levels[0]) == value],
-                key=lambda x: -x.severity.value,
+            value: _organize(
+                partitioned_messages_at_depth=_partition_messages(
+                    messages=partitioned_messages_at_depth[value], level=levels[depth + 1]
+                ),
+                depth=depth + 1,
             )
             for value in sorted_values
         }
+
+    return _organize(partitioned_messages_at_depth=partitioned_messages, depth=0)
@@ -17,6 +17,10 @@ duration_regex = (
 )
 species_form_regex = r"([A-Z][a-z]* [a-z]+)|(http://purl.obolibrary.org/obo/NCBITaxon_\d+)"
 
+# Compiled once on import rather than looked up from the `re` module cache on every check evaluation
+_DURATION_PATTERN = re.compile(duration_regex)
+_SPECIES_FORM_PATTERN = re.compile(species_form_regex)
+
 PROCESSING_MODULE_CONFIG = ["ophys", "ecephys", "icephys", "behavior", "misc", "ogen", "retinotopy"]
 
 
@@ -170,14 +174,14 @@ def check_subject_age(subject: Subject) -> Optional[InspectorMessage]:
         )
     elif subject.age is None and subject.date_of_birth is not None:
         return None
-    if re.fullmatch(pattern=duration_regex, string=subject.age):
+    if _DURATION_PATTERN.fullmatch(string=subject.age):
         return None
 
     if "/" in subject.age:
         subject_lower_age_bound, subject_upper_age_bound = subject.age.split("/")
 
-        if re.fullmatch(pattern=duration_regex, string=subject_lower_age_bound) and (
-            re.fullmatch(pattern=duration_regex, string=subject_upper_age_bound) or subject_upper_age_bound == ""
+        if _DURATION_PATTERN.fullmatch(string=subject_lower_age_bound) and (
+            _DURATION_PATTERN.fullmatch(string=subject_upper_age_bound) or subject_upper_age_bound == ""
         ):
             return None
 
@@ -201,8 +205,8 @@ def check_subject_proper_age_range(subject: Subject) -> Optional[InspectorMessag
     if subject.age is not None and "/" in subject.age:
         subject_lower_age_bound, subject_upper_age_bound = subject.age.split("/")
 
-        if re.fullmatch(pattern=duration_regex, string=subject_lower_age_bound) and re.fullmatch(
-            pattern=duration_regex, string=subject_upper_age_bound
+        if _DURATION_PATTERN.fullmatch(string=subject_lower_age_bound) and _DURATION_PATTERN.fullmatch(
+            string=subject_upper_age_bound
         ):
             lower = parse_duration(subject_lower_age_bound)
             if isinstance(lower, Duration):
@@ -289,7 +293,7 @@ def check_subject_species_form(subject: Subject) -> Optional[InspectorMessage]:
 
     Best Practice: :ref:`best_practice_subject_species`
     """
-    if subject.species and not re.fullmatch(species_form_regex, subject.species):
+    if subject.species and not _SPECIES_FORM_PATTERN.fullmatch(subject.species):
         return InspectorMessage(
             message=(
                 f"Subject species '{subject.species}' should either be in Latin binomial form (e.g., 'Mus musculus' and "
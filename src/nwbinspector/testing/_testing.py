@@ -2,9 +2,9 @@
 
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from urllib import request
 from uuid import uuid4
 
 import zarr
@@ -26,32 +26,28 @@ def check_streaming_tests_enabled() -> tuple[bool, Optional[str]]:
     Returns the boolean status of the check and, if False, provides a string reason for the failure for the user to
     utilize as they please (raise an error or warning with that message, print it, or ignore it).
     """
-    failure_reason: str = ""
+    failure_reasons: list[str] = []
 
-    environment_skip_flag = os.environ.get("NWBI_SKIP_NETWORK_TESTS", "")
-    environment_skip_flag_bool = (
-        strtobool(os.environ.get("NWBI_SKIP_NETWORK_TESTS", "")) if environment_skip_flag != "" else False
-    )
-    if environment_skip_flag_bool:
-        failure_reason += "Environmental variable set to skip network tests."
+    environment_skip_flag = os.environ.get("NWBI_SKIP_NETWORK_TESTS", "").strip()
+    environment_skip_flag_bool = strtobool(environment_skip_flag) if environment_skip_flag != "" else False
+    if environment_skip_flag_bool:  # No need to probe the network or the installed packages
+        return False, "Environmental variable set to skip network tests."
 
     streaming_enabled, streaming_failure_reason = check_streaming_enabled()
     if not streaming_enabled and streaming_failure_reason is not None:
-        failure_reason += streaming_failure_reason
+        failure_reasons.append(streaming_failure_reason)
 
     have_dandi = is_module_installed("dandi")
     if not have_dandi:
-        failure_reason += "The DANDI package is not installed on the system."
+        failure_reasons.append("The DANDI package is not installed on the system.")
 
     have_remfile = is_module_installed("remfile")
     if not have_remfile:
-        failure_reason += "The `remfile` package is not installed on the system."
+        failure_reasons.append("The `remfile` package is not installed on the system.")
 
-    return_failure_reason: Optional[str] = None
-    if failure_reason != "":
-        return_failure_reason = failure_reason
+    return_failure_reason: Optional[str] = "".join(failure_reasons) or None
 
-    return streaming_enabled and not environment_skip_flag_bool and have_dandi, return_failure_reason
+    return streaming_enabled and have_dandi, return_failure_reason
 
 
 def generate_testing_files() -> None:  # pragma: no cover
@@ -62,9 +58,11 @@ def generate_testing_files() -> None:  # pragma: no cover
 def generate_image_series_testing_files() -> None:  # pragma: no cover
     """Generate a local copy of the NWB files required for the image series tests."""
     assert get_package_version(name="pynwb") == Version("2.1.0"), "Generating the testing files requires PyNWB v2.1.0!"
-    assert TESTING_FILES_FOLDER_PATH is not None, "The `TESTING_FILES_FOLDER_PATH` environment variable is not set!"
+    # Read at call time (rather than using the module constant) so that the variable may also be set after import
+    testing_files_folder_path = os.environ.get("TESTING_FILES_FOLDER_PATH", None)
+    assert testing_files_folder_path is not None, "The `TESTING_FILES_FOLDER_PATH` environment variable is not set!"
 
-    testing_folder = Path(TESTING_FILES_FOLDER_PATH)
+    testing_folder = Path(testing_files_folder_path)
     testing_folder.mkdir(exist_ok=True)
 
     movie_1_file_path = testing_folder / "temp_movie_1.mov"
@@ -72,17 +70,13 @@ def generate_image_series_testing_files() -> None:  # pragma: no cover
     nested_folder.mkdir(exist_ok=True)
     movie_2_file_path = nested_folder / "temp_movie_2.avi"
     for file_path in [movie_1_file_path, movie_2_file_path]:
-        with open(file=file_path, mode="w") as file:
-            file.write("Not a movie file, but at least it exists.")
+        file_path.write_text("Not a movie file, but at least it exists.")
     nwbfile = make_minimal_nwbfile()
     nwbfile.add_acquisition(
         ImageSeries(
             name="TestImageSeriesGoodExternalPaths",
             rate=1.0,
-            external_file=[
-                "/".join([".", movie_1_file_path.name]),
-                "/".join([".", nested_folder.name, movie_2_file_path.name]),
-            ],
+            external_file=[f"./{movie_1_file_path.name}", f"./{nested_folder.name}/{movie_2_file_path.name}"],
         )
     )
     nwbfile.add_acquisition(
@@ -109,16 +103,24 @@ def make_minimal_nwbfile() -> NWBFile:
     return NWBFile(session_description="", identifier=str(uuid4()), session_start_time=datetime.now().astimezone())
 
 
+@lru_cache(maxsize=1)
 def check_streaming_enabled() -> tuple[bool, Optional[str]]:
     """
     General purpose helper for determining if the environment can support S3 DANDI streaming.
 
     Returns the boolean status of the check and, if False, provides a string reason for the failure for the user to
     utilize as they please (raise an error or warning with that message, print it, or ignore it).
+
+    The result is cached for the session, since every testing module probes this on import.
     """
+    # Only needed for this network probe, so avoid the import cost on every session
+    from urllib import request
+
+    # Only the headers are needed to confirm access, not the contents of the file
+    probe = request.Request(url="https://dandiarchive.s3.amazonaws.com/ros3test.nwb", method="HEAD")
     try:
-        request.urlopen("https://dandiarchive.s3.amazonaws.com/ros3test.nwb", timeout=1)
-    except request.URLError:  # type: ignore
+        request.urlopen(probe, timeout=1)
+    except OSError:  # Includes URLError, as well as timeouts while reading the response
         return False, "Internet access to DANDI failed."
     return True, None
 
@@ -126,8 +128,13 @@ def check_streaming_enabled() -> tuple[bool, Optional[str]]:
 def check_hdf5_io_open(io: HDF5IO) -> bool:
     """
     Check if an h5py.File object is open by using the file .id attribute, which is invalid when the file is closed.
+
+    Also reports the file as closed if the IO no longer holds a file at all.
     """
-    return io._file.id.valid
+    try:
+        return io._file.id.valid
+    except AttributeError:
+        return False
 
 
 def check_zarr_io_open(io: HDMFIO) -> bool:
@@ -1,11 +1,13 @@
 """Helper functions related to DANDI for internal use that rely on external dependencies (i.e., dandi)."""
 
 import re
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from ..utils import calculate_number_of_cpu, is_module_installed
 
+_DANDISET_ID_PATTERN = re.compile(pattern="^[0-9]{6}$")
+
 
 def get_s3_urls_and_dandi_paths(dandiset_id: str, version_id: Optional[str] = None, n_jobs: int = 1) -> dict[str, str]:
     """
@@ -16,8 +18,8 @@ def get_s3_urls_and_dandi_paths(dandiset_id: str, version_id: Optional[str] = No
     assert is_module_installed(module_name="dandi"), "You must install DANDI to get S3 paths (pip install dandi)."
     from dandi.dandiapi import DandiAPIClient
 
-    assert re.fullmatch(
-        pattern="^[0-9]{6}$", string=dandiset_id
+    assert _DANDISET_ID_PATTERN.fullmatch(
+        string=dandiset_id
     ), "The specified 'path' is not a proper DANDISet ID. It should be a six-digit numeric identifier."
 
     s3_urls_to_dandi_paths = dict()
@@ -26,22 +28,17 @@ def get_s3_urls_and_dandi_paths(dandiset_id: str, version_id: Optional[str] = No
         with DandiAPIClient() as client:
             dandiset = client.get_dandiset(dandiset_id=dandiset_id, version_id=version_id)
             max_workers = n_jobs if n_jobs > 0 else None
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                futures = []
-                for asset in dandiset.get_assets():
-                    if asset.path.split(".")[-1] == "nwb":
-                        futures.append(
-                            executor.submit(
-                                _get_content_url_and_path, asset=asset, follow_redirects=1, strip_query=True
-                            )
-                        )
-                    for future in as_completed(futures):
-                        s3_urls_to_dandi_paths.update(future.result())
+            # Resolving the content URLs is bound by network requests, so threads avoid the cost of spawning processes
+            # and pickling each asset; results are also gathered in the same order as the serial case
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                nwb_assets = (asset for asset in dandiset.get_assets() if asset.path.endswith(".nwb"))
+                for content_url_and_path in executor.map(_get_content_url_and_path, nwb_assets):
+                    s3_urls_to_dandi_paths.update(content_url_and_path)
     else:
         with DandiAPIClient() as client:
             dandiset = client.get_dandiset(dandiset_id=dandiset_id, version_id=version_id)
             for asset in dandiset.get_assets():
-                if asset.path.split(".")[-1] == "nwb":
+                if asset.path.endswith(".nwb"):
                     s3_urls_to_dandi_paths.update(_get_content_url_and_path(asset=asset))
     return s3_urls_to_dandi_paths
 
@@ -51,9 +48,5 @@ def _get_content_url_and_path(
     follow_redirects: int = 1,
     strip_query: bool = True,
 ) -> dict[str, str]:
-    """
-    Private helper function for parallelization in 'get_s3_urls_and_dandi_paths'.
-
-    Must be globally defined (not as a part of get_s3_urls..) in order to be pickled.
-    """
-    return {asset.get_content_url(follow_redirects=1, strip_query=True): asset.path}
+    """Private helper function for parallelization in 'get_s3_urls_and_dandi_paths'."""
+    return {asset.get_content_url(follow_redirects=follow_redirects, strip_query=strip_query): asset.path}
@@ -1,15 +1,21 @@
 """Helper functions related to NWB for internal use that rely on external dependencies (i.e., pynwb)."""
 
-from typing import Iterable, Type
+from typing import Iterable, Type, Union
 
 from pynwb import NWBFile
 
 
-def all_of_type(nwbfile: NWBFile, neurodata_type: Type) -> Iterable[object]:
-    """Iterate over all objects inside an NWBFile object and return those that match the given neurodata_type."""
-    for neurodata_object in nwbfile.objects.values():
-        if isinstance(neurodata_object, neurodata_type):
-            yield neurodata_object
+def all_of_type(nwbfile: NWBFile, neurodata_type: Union[Type, tuple[Type, ...]]) -> Iterable[object]:
+    """
+    Iterate over all objects inside an NWBFile object and return those that match the given neurodata_type.
+
+    A tuple of types may be given to collect objects of any of those types in a single pass over the file.
+    """
+    return (
+        neurodata_object
+        for neurodata_object in nwbfile.objects.values()
+        if isinstance(neurodata_object, neurodata_type)
+    )
 
 
 def get_nwbfile_path_from_internal_object(neurodata_object: object) -> str:
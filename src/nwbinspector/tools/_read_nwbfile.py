@@ -1,8 +1,10 @@
 """Temporary module for thorough testing and evaluation of the proposed `read_nwbfile` helper function."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional, Union
-from warnings import filterwarnings
+from typing import BinaryIO, Literal, Optional, Union
+from warnings import catch_warnings, filterwarnings
 
 import h5py
 from hdmf.backends.io import HDMFIO
@@ -13,12 +15,19 @@ BACKEND_IO_CLASSES = dict(
     hdf5=NWBHDF5IO,
     zarr=NWBZarrIO,
 )
+REMOTE_PROTOCOLS = ("https://", "http://", "s3://")
+HDF5_SUFFIXES = (".h5", ".hdf5")  # Not '.nwb', which is also used for Zarr stores
+HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"  # The first bytes of an HDF5 file without a user block
+ZARR_GROUP_METADATA_FILE_NAMES = (".zgroup", "zarr.json")  # Present at the root of Zarr v2 and v3 stores respectively
+FSSPEC_BLOCK_SIZE = 4 * 1024 * 1024  # In bytes; the size of each block cached when streaming with fsspec
+HDF5_CHUNK_CACHE_SIZE = 32 * 1024 * 1024  # In bytes; the size of the raw data chunk cache of each streamed dataset
+HDF5_CHUNK_CACHE_SLOTS = 100_003  # Prime, and well above the number of chunks that fit in the cache to avoid collisions
 
 
 def _get_method(path: str) -> Literal["local", "fsspec"]:
-    if path.startswith(("https://", "http://", "s3://")):
+    if path.startswith(REMOTE_PROTOCOLS):
         return "fsspec"
-    elif Path(path).exists():
+    elif os.path.exists(path):
         return "local"
     else:
         message = (
@@ -29,47 +38,134 @@ def _get_method(path: str) -> Literal["local", "fsspec"]:
 
 
 def _init_fsspec(path: str) -> "fsspec.AbstractFileSystem":  # type: ignore
-    import fsspec
-
     if path.startswith(("https://", "http://")):
-        return fsspec.filesystem("http")
+        return _get_fsspec_filesystem(protocol="http")
     elif path.startswith("s3://"):
-        return fsspec.filesystem("s3", anon=True)
+        return _get_fsspec_filesystem(protocol="s3")
     else:
         message = f"Unable to initialize fsspec on path '{path}'."
         raise ValueError(message)
 
 
-def _get_backend(path: str, method: Literal["local", "fsspec", "ros3"]) -> Union[str, Literal["hdf5", "zarr"]]:
+@lru_cache(maxsize=None)
+def _get_fsspec_filesystem(protocol: Literal["http", "s3"]) -> "fsspec.AbstractFileSystem":  # type: ignore
+    """
+    Construct the filesystem for each protocol only once, since it is requested at least twice per file read.
+
+    Reusing the same instance also reuses its underlying HTTP session, so connections (and TLS handshakes) to the same
+    host are pooled across all files read by the process.
+    """
+    import fsspec
+
+    if protocol == "s3":
+        return fsspec.filesystem("s3", anon=True)
+    # Respect the proxy settings of the environment, as most other HTTP clients do
+    return fsspec.filesystem(protocol, client_kwargs=dict(trust_env=True))
+
+
+# The filesystems hold network sessions that cannot be shared with forked worker processes
+if hasattr(os, "register_at_fork"):  # Not available on Windows
+    os.register_at_fork(after_in_child=_get_fsspec_filesystem.cache_clear)
+
+
+def _open_fsspec_file(
+    path: str, fsspec_block_size: int = FSSPEC_BLOCK_SIZE, cache_dir: Optional[Union[str, Path]] = None
+) -> "fsspec.spec.AbstractBufferedFile":  # type: ignore
+    filesystem = _init_fsspec(path=path)
+
+    if cache_dir is not None:
+        import fsspec
+
+        # Fetched blocks are kept in a sparse local copy of the file, so reopening it does not download them again
+        caching_filesystem = fsspec.filesystem("blockcache", fs=filesystem, cache_storage=str(cache_dir))
+        return caching_filesystem.open(path=path, mode="rb", block_size=fsspec_block_size)
+
+    # HDF5 metadata is scattered across many small reads; an LRU cache of blocks avoids re-requesting them
+    return filesystem.open(path=path, mode="rb", cache_type="blockcache", block_size=fsspec_block_size)
+
+
+def _has_hdf5_signature(file: BinaryIO) -> bool:
+    """Check the first bytes of an open binary file against the signature of an HDF5 file without a user block."""
+    file.seek(0)
+    return file.read(len(HDF5_SIGNATURE)) == HDF5_SIGNATURE
+
+
+def _open_hdf5_file(name: Union[str, BinaryIO], chunk_cache_size: int = HDF5_CHUNK_CACHE_SIZE) -> h5py.File:
+    """
+    Open a streamed HDF5 file for reading with a larger raw data chunk cache than the HDF5 default of 1 MiB.
+
+    Several checks read the same parts of a dataset (such as the timestamps), so keeping more decompressed chunks in
+    memory avoids re-requesting them from the remote file. Local files are opened by the IO class itself instead, since
+    each dataset gets its own cache and rereading from disk is cheap.
+    """
+    return h5py.File(name, mode="r", rdcc_nbytes=chunk_cache_size, rdcc_nslots=HDF5_CHUNK_CACHE_SLOTS)
+
+
+def _get_backend(
+    path: str,
+    method: Literal["local", "fsspec", "ros3"],
+    fsspec_block_size: int = FSSPEC_BLOCK_SIZE,
+    fsspec_file: Optional["fsspec.spec.AbstractBufferedFile"] = None,  # type: ignore
+) -> Union[str, Literal["hdf5", "zarr"]]:
     if method == "ros3":
         return "hdf5"
 
-    possible_backends = []
+    # Unambiguous names identify the backend without opening the file; '.nwb' may be either, so it is always probed
+    # Local files are probed regardless, since reading their signature is cheap and catches files that are not HDF5
+    lowered_path = path.lower().rstrip("/")
+    if lowered_path.endswith(".zarr"):
+        return "zarr"
+    if method == "fsspec" and lowered_path.endswith(HDF5_SUFFIXES):
+        return "hdf5"
+
+    # A file can only be valid for one of the backends, so stop at the first one able to read it
     if method == "fsspec":
-        filesystem = _init_fsspec(path=path)
-        with filesystem.open(path=path, mode="rb") as file:
+        # Probe an already opened remote file if given, so that the blocks fetched here are reused when reading it
+        file = (
+            fsspec_file
+            if fsspec_file is not None
+            else _open_fsspec_file(path=path, fsspec_block_size=fsspec_block_size)
+        )
+        try:
+            # The signature of an HDF5 file is enough to identify it without probing each backend
+            if _has_hdf5_signature(file=file):
+                return "hdf5"
+
             for backend_name, backend_class in BACKEND_IO_CLASSES.items():
+                file.seek(0)
                 if backend_class.can_read(path=file):
-                    possible_backends.append(backend_name)
+                    return backend_name
+        finally:
+            if fsspec_file is None:
+                file.close()
+            else:
+                file.seek(0)
     else:
+        # Cheap structural checks avoid fully opening the file with each backend in the common cases
+        local_path = Path(path)
+        if local_path.is_dir() and any((local_path / name).exists() for name in ZARR_GROUP_METADATA_FILE_NAMES):
+            return "zarr"
+        if local_path.is_file():
+            with open(file=local_path, mode="rb") as file:
+                if _has_hdf5_signature(file=file):
+                    return "hdf5"
+
+        # Fall back to each backend; for instance, HDF5 files with a user block store the signature at a later offset
         for backend_name, backend_class in BACKEND_IO_CLASSES.items():
             if backend_class.can_read(path):
-                possible_backends.append(backend_name)
+                return backend_name
 
-    if len(possible_backends) > 1:  # pragma: no cover
-        raise ValueError(
-            f"More than one possible backend found - please choose from the following: {possible_backends}"
-        )
-    elif len(possible_backends) == 0:
-        raise ValueError("No compatible backend found.")
-
-    return possible_backends[0]
+    raise ValueError("No compatible backend found.")
 
 
 def read_nwbfile(
     nwbfile_path: Union[str, Path],
     method: Optional[Literal["local", "fsspec", "ros3"]] = None,
     backend: Optional[Literal["hdf5", "zarr"]] = None,
+    fsspec_block_size: int = FSSPEC_BLOCK_SIZE,
+    load_namespaces: bool = True,
+    cache_dir: Optional[Union[str, Path]] = None,
+    hdf5_chunk_cache_size: int = HDF5_CHUNK_CACHE_SIZE,
 ) -> NWBFile:
     """
     Read an NWB file using the specified (or auto-detected) method and specified (or auto-detected) backend.
@@ -86,13 +182,33 @@ def read_nwbfile(
     backend : "hdf5", "zarr", or None (default)
         Type of backend used to write the file.
         The default auto-detects the type of the file.
+    fsspec_block_size : int, default: 4 MiB
+        When streaming with fsspec, the size in bytes of each block requested from the remote file and cached.
+    load_namespaces : bool, default: True
+        Whether to load the namespaces cached in the file, which is required to read files that use extensions.
+        Files that only use the core namespace of the installed version of PyNWB can skip this for a faster open.
+    cache_dir : str or pathlib.Path, optional
+        When streaming with fsspec, a local directory in which to keep the blocks fetched from the remote file.
+        Subsequent reads of the same file then reuse those blocks instead of requesting them again.
+        The default only caches blocks in memory for as long as the file is open.
+    hdf5_chunk_cache_size : int, default: 32 MiB
+        When streaming an HDF5 file with fsspec, the size in bytes of the raw data chunk cache of each dataset.
+        Local files are left to the default cache of the IO class.
 
     Returns
     -------
     nwbfile : pynwb.NWBFile
         The in-memory NWBFile object.
     """
-    nwbfile, _ = _read_nwbfile_helper(nwbfile_path=nwbfile_path, method=method, backend=backend)
+    nwbfile, _ = _read_nwbfile_helper(
+        nwbfile_path=nwbfile_path,
+        method=method,
+        backend=backend,
+        fsspec_block_size=fsspec_block_size,
+        load_namespaces=load_namespaces,
+        cache_dir=cache_dir,
+        hdf5_chunk_cache_size=hdf5_chunk_cache_size,
+    )
 
     # Note: do not be concerned about IO object closing due to garbage collection here
     # (the IO object is attached as an attribute to the NWBFile object)
@@ -103,6 +219,10 @@ def read_nwbfile_and_io(
     nwbfile_path: Union[str, Path],
     method: Optional[Literal["local", "fsspec", "ros3"]] = None,
     backend: Optional[Literal["hdf5", "zarr"]] = None,
+    fsspec_block_size: int = FSSPEC_BLOCK_SIZE,
+    load_namespaces: bool = True,
+    cache_dir: Optional[Union[str, Path]] = None,
+    hdf5_chunk_cache_size: int = HDF5_CHUNK_CACHE_SIZE,
 ) -> tuple[NWBFile, HDMFIO]:
     """
     Read an NWB file using the specified (or auto-detected) method and specified (or auto-detected) backend.
@@ -119,6 +239,18 @@ def read_nwbfile_and_io(
     backend : "hdf5", "zarr", or None (default)
         Type of backend used to write the file.
         The default auto-detects the type of the file.
+    fsspec_block_size : int, default: 4 MiB
+        When streaming with fsspec, the size in bytes of each block requested from the remote file and cached.
+    load_namespaces : bool, default: True
+        Whether to load the namespaces cached in the file, which is required to read files that use extensions.
+        Files that only use the core namespace of the installed version of PyNWB can skip this for a faster open.
+    cache_dir : str or pathlib.Path, optional
+        When streaming with fsspec, a local directory in which to keep the blocks fetched from the remote file.
+        Subsequent reads of the same file then reuse those blocks instead of requesting them again.
+        The default only caches blocks in memory for as long as the file is open.
+    hdf5_chunk_cache_size : int, default: 32 MiB
+        When streaming an HDF5 file with fsspec, the size in bytes of the raw data chunk cache of each dataset.
+        Local files are left to the default cache of the IO class.
 
     Returns
     -------
@@ -128,7 +260,15 @@ def read_nwbfile_and_io(
         Only passed if `return_io` is True.
         The initialized HDMFIO object used to read the file.
     """
-    nwbfile, io = _read_nwbfile_helper(nwbfile_path=nwbfile_path, method=method, backend=backend)
+    nwbfile, io = _read_nwbfile_helper(
+        nwbfile_path=nwbfile_path,
+        method=method,
+        backend=backend,
+        fsspec_block_size=fsspec_block_size,
+        load_namespaces=load_namespaces,
+        cache_dir=cache_dir,
+        hdf5_chunk_cache_size=hdf5_chunk_cache_size,
+    )
 
     return nwbfile, io
 
@@ -137,16 +277,22 @@ def _read_nwbfile_helper(
     nwbfile_path: Union[str, Path],
     method: Optional[Literal["local", "fsspec", "ros3"]] = None,
     backend: Optional[Literal["hdf5", "zarr"]] = None,
+    fsspec_block_size: int = FSSPEC_BLOCK_SIZE,
+    load_namespaces: bool = True,
+    cache_dir: Optional[Union[str, Path]] = None,
+    hdf5_chunk_cache_size: int = HDF5_CHUNK_CACHE_SIZE,
 ) -> tuple[NWBFile, HDMFIO]:
-    nwbfile_path = str(nwbfile_path)  # If pathlib.Path, cast to str; if already str, no harm done
+    nwbfile_path = os.fspath(nwbfile_path)  # If pathlib.Path, cast to str; if already str, no harm done
 
     method = method or _get_method(nwbfile_path)
-    if method != "local" and Path(nwbfile_path).exists():
+    # A URL can never be a local path, so only query the filesystem when it might be one
+    is_url = nwbfile_path.startswith(REMOTE_PROTOCOLS)
+    if method != "local" and not is_url and os.path.exists(nwbfile_path):
         raise ValueError(
             f"The file ({nwbfile_path}) is a local path on your system, but the method ({method}) was selected! "
             "Please set method='local'."
         )
-    if method == "local" and any(protocol in nwbfile_path for protocol in ["s3://", "https://"]):
+    if method == "local" and is_url:
         raise ValueError(
             f"The path ({nwbfile_path}) is an external URL, but the method (local) was selected! "
             "Please set method='fsspec' or 'ros3' (for HDF5 only)."
@@ -156,27 +302,46 @@ def _read_nwbfile_helper(
             "The ROS3 method was selected, but the URL starts with 's3://'! Please switch to an 'https://' URL."
         )
 
-    chosen_backend = backend or _get_backend(path=nwbfile_path, method=method)
-    # Temporary until .can_read() is able to work on streamed bytes
-    if method == "local" and not BACKEND_IO_CLASSES[chosen_backend].can_read(path=nwbfile_path):
-        raise IOError(
-            f"The chosen backend ({chosen_backend}) is unable to read the file! Please select a different backend."
+    # When streaming with fsspec, the remote file is only opened once, both to determine the backend and to read it
+    fsspec_file = None
+    if method == "fsspec":
+        fsspec_file = _open_fsspec_file(path=nwbfile_path, fsspec_block_size=fsspec_block_size, cache_dir=cache_dir)
+
+    # Anything opened here is otherwise only closed with the IO object, which is never returned if the read fails
+    file = None
+    io = None
+    try:
+        chosen_backend = backend or _get_backend(
+            path=nwbfile_path, method=method, fsspec_block_size=fsspec_block_size, fsspec_file=fsspec_file
         )
+        # Temporary until .can_read() is able to work on streamed bytes
+        if method == "local" and not BACKEND_IO_CLASSES[chosen_backend].can_read(path=nwbfile_path):
+            raise IOError(
+                f"The chosen backend ({chosen_backend}) is unable to read the file! Please select a different backend."
+            )
 
-    # Filter out some common warnings that don't really matter with `load_namespaces=True`
-    filterwarnings(action="ignore", message="No cached namespaces found in .*")
-    filterwarnings(action="ignore", message="Ignoring cached namespace .*")
-    io_kwargs = dict(mode="r", load_namespaces=True)
-    if method == "fsspec":
-        fs = _init_fsspec(nwbfile_path)
-        f = fs.open(nwbfile_path, "rb")
-        file = h5py.File(f)
-        io_kwargs.update(file=file)
-    else:
-        io_kwargs.update(path=nwbfile_path)
-    if method == "ros3":
-        io_kwargs.update(driver="ros3")
-    io = BACKEND_IO_CLASSES[chosen_backend](**io_kwargs)
-    nwbfile = io.read()
+        io_kwargs = dict(mode="r", load_namespaces=load_namespaces)
+        if fsspec_file is not None:  # Only opened when method="fsspec"
+            file = _open_hdf5_file(name=fsspec_file, chunk_cache_size=hdf5_chunk_cache_size)
+            io_kwargs.update(file=file)
+        else:
+            io_kwargs.update(path=nwbfile_path)
+        if method == "ros3":
+            io_kwargs.update(driver="ros3")
+        # Filter out some common warnings that don't really matter with `load_namespaces=True`
+        # Scoped to the read so that the global warning filters are not modified on every call
+        with catch_warnings():
+            filterwarnings(action="ignore", message="No cached namespaces found in .*")
+            filterwarnings(action="ignore", message="Ignoring cached namespace .*")
+            io = BACKEND_IO_CLASSES[chosen_backend](**io_kwargs)
+            nwbfile = io.read()
+    except Exception:
+        if io is not None:
+            io.close()
+        if file is not None:
+            file.close()
+        if fsspec_file is not None:
+            fsspec_file.close()
+        raise
 
     return nwbfile, io
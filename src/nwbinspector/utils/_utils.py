@@ -3,10 +3,22 @@
 import json
 import os
 import re
+from collections import OrderedDict
 from functools import lru_cache
 from importlib import import_module
+from importlib.metadata import version as importlib_version
 from pathlib import Path
-from typing import Any, Optional, TypeVar, Union
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 import h5py
 import numpy as np
@@ -21,16 +33,132 @@ FilePathType = TypeVar("FilePathType", str, Path)
 OptionalListOfStrings = Optional[list[str]]
 
 dict_regex = r"({.+:.+})"  # TODO: remove this from global scope
+_DICT_PATTERN = re.compile(pattern=dict_regex)
+_JSON_FIRST_CHARACTERS = frozenset('{["-0123456789tfnNI')  # Any value json.loads accepts, including NaN and Infinity
 MAX_CACHE_ITEMS = 1000  # lru_cache default is 128 calls of matching input/output, but might need more to get use here
+CHUNKED_READ_SIZE = 64 * 2**20  # Bytes to read at a time when scanning an entire chunked dataset
+BLOSC2_FILTER_ID = 32026  # Registered HDF5 filter ID of the Blosc2 compressor
+
+
+class _ScanResistantCache:
+    """
+    A segmented LRU cache, which keeps entries that are requested repeatedly safe from long scans of one-off requests.
+
+    New entries are first admitted to a small probationary segment and are only promoted to the protected segment
+    when requested again. A pass over many datasets that are each read once can therefore only evict other
+    probationary entries, never the selections that several checks keep coming back to (such as timestamps).
+    Entries pushed out of a full protected segment are demoted back to the probationary segment rather than dropped.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.probationary_maxsize = max(1, maxsize // 4)
+        self.protected_maxsize = max(1, maxsize - self.probationary_maxsize)
+        self._probationary: OrderedDict = OrderedDict()
+        self._protected: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()  # Shared module state, so guard it as `functools.lru_cache` does
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._protected:
+                self._hits += 1
+                self._protected.move_to_end(key)
+                return self._protected[key]
+            if key in self._probationary:
+                self._hits += 1
+                value = self._probationary.pop(key)
+                self._protected[key] = value
+                if len(self._protected) > self.protected_maxsize:
+                    # Demote the least recently used protected entry, giving it another chance before it is dropped
+                    self._admit_to_probationary(*self._protected.popitem(last=False))
+                return value
+            self._misses += 1
+
+        # Computed outside of the lock so that a slow read does not hold up lookups from other threads
+        value = compute()
+        with self._lock:
+            if key not in self._protected and key not in self._probationary:  # Unless another thread got there first
+                self._admit_to_probationary(key, value)
+        return value
+
+    def _admit_to_probationary(self, key: Hashable, value: Any) -> None:
+        self._probationary[key] = value
+        if len(self._probationary) > self.probationary_maxsize:
+            self._probationary.popitem(last=False)
+            self._evictions += 1
+
+    def cache_info(self) -> "_CacheInfo":
+        """Report the usage of the cache, in the same form as `functools.lru_cache` plus the number of evictions."""
+        with self._lock:
+            return _CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._probationary) + len(self._protected),
+                evictions=self._evictions,
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._probationary.clear()
+            self._protected.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+class _CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    evictions: int
+
+
+_DATA_SELECTION_CACHE = _ScanResistantCache(maxsize=MAX_CACHE_ITEMS)
+
+
+def _has_blosc2_filter(dataset: h5py.Dataset) -> bool:
+    create_property_list = dataset.id.get_create_plist()
+    return any(
+        create_property_list.get_filter(index)[0] == BLOSC2_FILTER_ID
+        for index in range(create_property_list.get_nfilters())
+    )
+
+
+def _with_fast_slicing(dataset: h5py.Dataset) -> Union[h5py.Dataset, Any]:
+    """
+    Wrap a Blosc2-compressed dataset so that its slices are read directly from the chunks, if `b2h5py` is installed.
+
+    This bypasses the HDF5 filter pipeline, which is several times slower at decompressing Blosc2 chunks.
+    Other datasets, and selections `b2h5py` cannot optimize, are read as usual.
+    """
+    if not is_module_installed(module_name="b2h5py") or not _has_blosc2_filter(dataset=dataset):
+        return dataset
+
+    from b2h5py import B2Dataset
+
+    return B2Dataset(dataset)
 
 
-@lru_cache(maxsize=MAX_CACHE_ITEMS)
 def _cache_data_retrieval_command(
     data: Union[h5py.Dataset, zarr.Array], reduced_selection: tuple[tuple[Optional[int], Optional[int], Optional[int]]]
 ) -> np.ndarray:
-    """LRU caching for _cache_data_selection cannot be applied to list inputs; this expects the tuple or Dataset."""
-    selection = tuple([slice(*reduced_slice) for reduced_slice in reduced_selection])  # reconstitute the slices
-    return data[selection]
+    """Caching for _cache_data_selection cannot be applied to list inputs; this expects the tuple or Dataset."""
+
+    def retrieve_selection() -> np.ndarray:
+        selection = tuple(slice(*reduced_slice) for reduced_slice in reduced_selection)  # reconstitute the slices
+        if isinstance(data, h5py.Dataset):
+            return _with_fast_slicing(dataset=data)[selection]
+        return data[selection]
+
+    return _DATA_SELECTION_CACHE.get_or_compute(key=(data, reduced_selection), compute=retrieve_selection)
+
+
+# Keep the same interface for inspecting the cache as when this was a `functools.lru_cache`
+_cache_data_retrieval_command.cache_info = _DATA_SELECTION_CACHE.cache_info  # type: ignore
+_cache_data_retrieval_command.cache_clear = _DATA_SELECTION_CACHE.cache_clear  # type: ignore
 
 
 def cache_data_selection(data: Union[h5py.Dataset, ArrayLike], selection: Union[slice, tuple[slice]]) -> np.ndarray:
@@ -40,15 +168,17 @@ def cache_data_selection(data: Union[h5py.Dataset, ArrayLike], selection: Union[
     if not (
         isinstance(data, h5py.Dataset) or isinstance(data, H5Dataset)
     ):  # No need to attempt to cache if data is already in-memory
-        # Cast as numpy array for efficient fancy indexing
-        # Note that this technically copies the entire data, so could use more than 2x RAM for that object
-        return np.array(data)[selection]
+        # Slice before casting as numpy array so that only the selection is copied
+        if isinstance(selection, slice):
+            return np.asarray(data[selection])  # type: ignore
+        # Lists and tuples do not support multidimensional selection, so these still need casting in full first
+        return np.asarray(data)[selection]
 
     # Slices aren't hashable, but their reduced representation is
     if isinstance(selection, slice):  # A single slice
-        reduced_selection = tuple([selection.__reduce__()[1]])
+        reduced_selection: tuple[Any, ...] = (selection.__reduce__()[1],)
     else:  # Iterable of slices
-        reduced_selection = tuple([selection_slice.__reduce__()[1] for selection_slice in selection])
+        reduced_selection = tuple(selection_slice.__reduce__()[1] for selection_slice in selection)
     return _cache_data_retrieval_command(data=data, reduced_selection=reduced_selection)
 
 
@@ -83,28 +213,118 @@ def format_byte_size(byte_size: int, units: str = "SI") -> str:
     return f"{num:.2f}Y{suffix}"
 
 
-def is_regular_series(series: np.ndarray, tolerance_decimals: int = 9) -> bool:
+def is_regular_series(series: Union[h5py.Dataset, ArrayLike], tolerance_decimals: int = 9) -> bool:
     """General purpose function for checking if the difference between all consecutive points in a series are equal."""
-    uniq_diff_ts = np.unique(np.diff(series).round(decimals=tolerance_decimals))
+    if isinstance(series, h5py.Dataset) and series.chunks is not None and series.ndim == 1:
+        return _is_regular_chunked_dataset(dataset=series, tolerance_decimals=tolerance_decimals)
+    rounded_differences = np.diff(series).round(decimals=tolerance_decimals)
+
+    return _has_single_value(values=rounded_differences)
 
-    return len(uniq_diff_ts) == 1
+
+def _has_single_value(values: np.ndarray) -> bool:
+    """
+    Determine if an array holds exactly one distinct value, counting all NaN as the same value like `np.unique` does.
+
+    Comparing the smallest and largest values avoids sorting the array to find its unique values.
+    """
+    if values.size == 0:
+        return False
+    minimum = values.min()
+    if np.isnan(minimum):  # Any NaN propagates through the minimum, so the values are only all the same if all NaN
+        return bool(np.isnan(values).all())
+    return bool(minimum == values.max())
+
+
+def _ascending_kernel(array: np.ndarray) -> bool:
+    """Single pass over a 1D array, ignoring NaN values and stopping at the first descending value."""
+    previous_value = -np.inf
+    for value in array:
+        if np.isnan(value):
+            continue
+        if value < previous_value:
+            return False
+        previous_value = value
+    return True
+
+
+@lru_cache(maxsize=1)
+def _get_compiled_ascending_kernel() -> Callable[[np.ndarray], bool]:
+    """Compile `_ascending_kernel` with numba, once per process."""
+    from numba import njit
+
+    # Not `fastmath`, since that assumes there are no NaN values to skip
+    # Not `cache`, since that fails when numba cannot find a writable location, such as for a read-only installation
+    return njit(_ascending_kernel)
 
 
 def is_ascending_series(series: Union[h5py.Dataset, ArrayLike], nelems: Optional[int] = None) -> bool:
     """General purpose function for determining if a series is monotonic increasing."""
+    if isinstance(series, h5py.Dataset) and nelems is None and series.chunks is not None and series.ndim == 1:
+        return _is_ascending_chunked_dataset(dataset=series)
     if isinstance(series, h5py.Dataset):
         data = cache_data_selection(data=series, selection=slice(nelems))
     else:
         data = series[:nelems]
 
+    data = np.asarray(data)
+    if data.ndim == 1 and data.dtype.kind in "fiu" and is_module_installed(module_name="numba"):
+        return bool(_get_compiled_ascending_kernel()(data))
+
     # Remove NaN values from the series
-    data = np.array(data)
     valid_data = data[~np.isnan(data)]
 
-    # Compute the differences between consecutive elements
-    differences = np.diff(valid_data)
-
-    return np.all(differences >= 0)
+    # Compare consecutive elements through views rather than allocating an array of their differences
+    return bool(np.all(valid_data[1:] >= valid_data[:-1]))
+
+
+def _iterate_chunk_aligned_blocks(dataset: h5py.Dataset) -> Iterator[np.ndarray]:
+    """Read a chunked 1D dataset in blocks of whole chunks, each of up to `CHUNKED_READ_SIZE` bytes."""
+    chunk_length = dataset.chunks[0]
+    block_length = chunk_length * max(1, CHUNKED_READ_SIZE // (chunk_length * dataset.dtype.itemsize))
+    sliceable_dataset = _with_fast_slicing(dataset=dataset)
+    for start in range(0, dataset.shape[0], block_length):
+        yield sliceable_dataset[start : start + block_length]
+
+
+def _is_ascending_chunked_dataset(dataset: h5py.Dataset) -> bool:
+    """Check an entire chunked dataset block by block, stopping at the first descending value."""
+    previous_value = None
+    for block in _iterate_chunk_aligned_blocks(dataset=dataset):
+        valid_block = block[~np.isnan(block)]
+        if valid_block.size == 0:
+            continue
+        if previous_value is not None and valid_block[0] < previous_value:
+            return False
+        if not np.all(valid_block[1:] >= valid_block[:-1]):
+            return False
+        previous_value = valid_block[-1]
+
+    return True
+
+
+def _is_regular_chunked_dataset(dataset: h5py.Dataset, tolerance_decimals: int) -> bool:
+    """Check an entire chunked dataset block by block, stopping at the first differing step."""
+    first_difference = None
+    previous_value = None
+    for block in _iterate_chunk_aligned_blocks(dataset=dataset):
+        if previous_value is None:
+            differences = np.diff(block)
+        else:  # Include the step across the boundary with the previous block
+            differences = np.diff(block, prepend=previous_value)
+        previous_value = block[-1]
+        if differences.size == 0:
+            continue
+
+        rounded_differences = differences.round(decimals=tolerance_decimals)
+        if not _has_single_value(values=rounded_differences):
+            return False
+        if first_difference is None:
+            first_difference = rounded_differences[0]
+        elif not _has_single_value(values=np.array([first_difference, rounded_differences[0]])):
+            return False
+
+    return first_difference is not None
 
 
 def is_dict_in_string(string: str) -> bool:
@@ -113,7 +333,10 @@ def is_dict_in_string(string: str) -> bool:
 
     Can also be the direct results of string casting a dictionary, *e.g.*, ``str(dict(a=1))``.
     """
-    return any(re.findall(pattern=dict_regex, string=string))
+    # Most strings contain neither character, so this avoids running the regex on them at all
+    if "{" not in string or ":" not in string:
+        return False
+    return _DICT_PATTERN.search(string=string) is not None
 
 
 def is_string_json_loadable(string: str) -> bool:
@@ -122,18 +345,23 @@ def is_string_json_loadable(string: str) -> bool:
 
     Rather than constructing a complicated regex pattern, a simple try/except of the json.load should suffice.
     """
+    stripped_string = string.lstrip(" \t\n\r")  # Only the whitespace allowed by the JSON grammar
+    if not stripped_string or stripped_string[0] not in _JSON_FIRST_CHARACTERS:
+        return False
+
     try:
-        json.loads(string)
+        json.loads(stripped_string)
         return True
-    except json.JSONDecodeError:
+    except ValueError:  # Parent of json.JSONDecodeError
         return False
 
 
+@lru_cache(maxsize=MAX_CACHE_ITEMS)
 def is_module_installed(module_name: str) -> bool:
     """
     Check if the given module is installed on the system.
 
-    Used for lazy imports.
+    Used for lazy imports. The result is cached, since the installed modules do not change within a session.
     """
     try:
         import_module(name=module_name)
@@ -142,10 +370,13 @@ def is_module_installed(module_name: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=MAX_CACHE_ITEMS)
 def get_package_version(name: str) -> version.Version:
     """
     Retrieve the version of a package regardless of if it has a __version__ attribute set.
 
+    The result is cached, since reading the package metadata requires searching the installed distributions.
+
     Parameters
     ----------
     name : str
@@ -156,16 +387,16 @@ def get_package_version(name: str) -> version.Version:
     version : Version
         The package version as an object from packaging.version.Version, which allows comparison to other versions.
     """
-    try:
-        from importlib.metadata import version as importlib_version
+    package_version = importlib_version(name)
 
-        package_version = importlib_version(name)
-    except ModuleNotFoundError:  # Remove the except clause when minimal supported version becomes 3.8
-        from pkg_resources import get_distribution
+    return version.parse(package_version)
 
-        package_version = get_distribution(name).version
 
-    return version.parse(package_version)
+def _get_available_cpu_count() -> int:
+    """Count the CPUs this process may run on, which can be fewer than on the machine (such as in containers)."""
+    if hasattr(os, "sched_getaffinity"):  # Not available on all platforms, such as macOS and Windows
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1  # Annotations say os.cpu_count can return None for some reason
 
 
 def calculate_number_of_cpu(requested_cpu: int = 1) -> int:
@@ -179,11 +410,11 @@ def calculate_number_of_cpu(requested_cpu: int = 1) -> int:
 
         The default is 1.
     """
-    total_cpu = os.cpu_count() or 1  # Annotations say os.cpu_count can return None for some reason
-    assert requested_cpu <= total_cpu, f"Requested more CPUs ({requested_cpu}) than are available ({total_cpu})!"
-    assert requested_cpu >= -(
-        total_cpu - 1
-    ), f"Requested fewer CPUs ({requested_cpu}) than are available ({total_cpu})!"
+    total_cpu = _get_available_cpu_count()
+    if requested_cpu > total_cpu:
+        raise ValueError(f"Requested more CPUs ({requested_cpu}) than are available ({total_cpu})!")
+    if requested_cpu < -(total_cpu - 1):
+        raise ValueError(f"Requested fewer CPUs ({requested_cpu}) than are available ({total_cpu})!")
     if requested_cpu > 0:
         return requested_cpu
     else:
@@ -197,7 +428,7 @@ def get_data_shape(data: Any, strict_no_data_load: bool = False) -> Optional[tup
     Modified from hdmf.utils.get_data_shape to return shape instead of maxshape.
 
     In order to determine the shape of nested tuples, lists, and sets, this function
-    recursively inspects elements along the dimensions, assuming that the data has a regular,
+    inspects the first element along each of the dimensions, assuming that the data has a regular,
     rectangular shape. In the case of out-of-core iterators, this means that the first item
     along each dimension would potentially be loaded into memory. Set strict_no_data_load=True
     to enforce that this does not happen, at the cost that we may not be able to determine
@@ -219,13 +450,30 @@ def get_data_shape(data: Any, strict_no_data_load: bool = False) -> Optional[tup
     """
 
     def __get_shape_helper(local_data: Any) -> tuple[int, ...]:
+        # Iterate rather than recurse through the dimensions to avoid the overhead of a call per dimension
         shape = list()
-        if hasattr(local_data, "__len__"):
-            shape.append(len(local_data))
-            if len(local_data):
-                el = next(iter(local_data))
-                if not isinstance(el, (str, bytes)):
-                    shape.extend(__get_shape_helper(el))
+        element = local_data
+        while True:
+            element_type = type(element)
+            if element_type is list or element_type is tuple:  # The most common case, which can simply be indexed
+                length = len(element)
+                shape.append(length)
+                if not length:
+                    break
+                element = element[0]
+            elif element_type is np.ndarray and element.dtype != object:  # Knows the rest of its shape already
+                shape.extend(element.shape)
+                break
+            elif hasattr(element, "__len__"):
+                length = len(element)
+                shape.append(length)
+                if not length:
+                    break
+                element = next(iter(element))
+            else:
+                break
+            if isinstance(element, (str, bytes)):
+                break
         return tuple(shape)
 
     if hasattr(data, "shape") and data.shape is not None:
@@ -239,20 +487,24 @@ def get_data_shape(data: Any, strict_no_data_load: bool = False) -> Optional[tup
     return None
 
 
+_STRTOBOOL = {
+    **dict.fromkeys(("y", "yes", "t", "true", "on", "1"), True),
+    **dict.fromkeys(("n", "no", "f", "false", "off", "0"), False),
+}
+
+
 def strtobool(val: str) -> bool:
     """
     Convert a string representation of truth to True or False.
 
     True values are 'y', 'yes', 't', 'true', 'on', and '1';
     False values are 'n', 'no', 'f', 'false', 'off', and '0'.
+    Surrounding whitespace is ignored.
     Raises ValueError if 'val' is anything else.
     """
     if not isinstance(val, str):
         raise TypeError(f"Invalid type of {val!r} - must be str for `strtobool`")
-    val = val.lower()
-    if val in ("y", "yes", "t", "true", "on", "1"):
-        return True
-    elif val in ("n", "no", "f", "false", "off", "0"):
-        return False
-    else:
-        raise ValueError(f"Invalid truth value {val!r}")
+    try:
+        return _STRTOBOOL[val.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Invalid truth value {val!r}") from None
@@ -14,6 +14,7 @@ from nwbinspector.testing import (
     check_zarr_io_open,
 )
 from nwbinspector.tools import read_nwbfile
+from nwbinspector.tools._read_nwbfile import HDF5_CHUNK_CACHE_SLOTS, _open_hdf5_file
 
 STREAMING_TESTS_ENABLED, DISABLED_STREAMING_TESTS_REASON = check_streaming_tests_enabled()
 
@@ -57,6 +58,25 @@ def test_incorrect_backend_set_on_zarr(zarr_nwbfile_path):
     )
 
 
+def test_nwb_suffix_on_non_nwb_file(tmp_path):
+    nwbfile_path = tmp_path / "not_an_nwbfile.nwb"
+    nwbfile_path.write_bytes(b"Neither an HDF5 file nor a Zarr store.")
+    with pytest.raises(ValueError, match="No compatible backend found."):
+        read_nwbfile(nwbfile_path=nwbfile_path)
+
+
+def test_failed_fsspec_read_closes_file(tmp_path, monkeypatch):
+    nwbfile_path = tmp_path / "not_an_nwbfile.nwb"
+    nwbfile_path.write_bytes(b"Neither an HDF5 file nor a Zarr store.")
+    byte_stream = open(nwbfile_path, mode="rb")
+    monkeypatch.setattr(
+        "nwbinspector.tools._read_nwbfile._open_fsspec_file", lambda path, fsspec_block_size, cache_dir: byte_stream
+    )
+    with pytest.raises(OSError):
+        read_nwbfile(nwbfile_path="https://example.com/not_an_nwbfile.nwb", backend="hdf5")
+    assert byte_stream.closed
+
+
 def test_incorrect_method_set_on_hdf5(hdf5_nwbfile_path):
     with pytest.raises(ValueError) as excinfo:
         read_nwbfile(nwbfile_path=hdf5_nwbfile_path, method="fsspec")
@@ -130,6 +150,25 @@ def test_hdf5_object_replacement_does_not_close_io(hdf5_nwbfile_path):
     assert check_hdf5_io_open(io=io_2)
 
 
+def test_hdf5_without_loading_namespaces(hdf5_nwbfile_path):
+    nwbfile = read_nwbfile(nwbfile_path=hdf5_nwbfile_path, load_namespaces=False)
+    assert "TimeSeries" in nwbfile.acquisition
+
+
+def test_hdf5_chunk_cache_local_default(hdf5_nwbfile_path):
+    nwbfile = read_nwbfile(nwbfile_path=hdf5_nwbfile_path)
+    with NWBHDF5IO(path=str(hdf5_nwbfile_path), mode="r") as io:
+        assert nwbfile.read_io._file.id.get_access_plist().get_cache() == io._file.id.get_access_plist().get_cache()
+    nwbfile.read_io.close()
+
+
+def test_hdf5_chunk_cache_size(hdf5_nwbfile_path):
+    with open(hdf5_nwbfile_path, mode="rb") as byte_stream:
+        with _open_hdf5_file(name=byte_stream, chunk_cache_size=8 * 1024 * 1024) as file:
+            _, rdcc_nslots, rdcc_nbytes, _ = file.id.get_access_plist().get_cache()
+    assert (rdcc_nslots, rdcc_nbytes) == (HDF5_CHUNK_CACHE_SLOTS, 8 * 1024 * 1024)
+
+
 # Zarr tests
 def test_zarr_explicit_closure(zarr_nwbfile_path):
     nwbfile = read_nwbfile(nwbfile_path=zarr_nwbfile_path)
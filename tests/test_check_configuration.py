@@ -10,7 +10,7 @@ from nwbinspector import (
     load_config,
     validate_config,
 )
-from nwbinspector._configuration import _copy_function
+from nwbinspector._configuration import _cached_configure_checks, _copy_function
 from nwbinspector.checks import (
     check_data_orientation,
     check_regular_timestamps,
@@ -86,6 +86,24 @@ class TestCheckConfiguration(TestCase):
         checks_out = configure_checks(checks=self.checks, config=config)
         self.assertListEqual(list1=[x.__name__ for x in checks_out], list2=[x.__name__ for x in self.checks[:3]])
 
+    def test_configure_checks_only_copies_configured_checks(self):
+        config = dict(CRITICAL=["check_small_dataset_compression"])
+        checks_out = configure_checks(checks=self.checks, config=config)
+        assert checks_out[0] is not check_small_dataset_compression
+        assert check_small_dataset_compression.importance is not Importance.CRITICAL
+        assert checks_out[1:] == self.checks[1:]
+        assert all(check_out is check for check_out, check in zip(checks_out[1:], self.checks[1:]))
+
+    def test_cached_configure_checks(self):
+        config = dict(CRITICAL=["check_small_dataset_compression"])
+        checks_out = _cached_configure_checks(checks=self.checks, config=config)
+        assert isinstance(checks_out, tuple)
+        assert checks_out is _cached_configure_checks(checks=list(self.checks), config=dict(config))
+        assert checks_out[0].importance is Importance.CRITICAL
+        assert [x.__name__ for x in checks_out] == [
+            x.__name__ for x in configure_checks(checks=self.checks, config=config)
+        ]
+
     def test_bad_schema(self):
         config = dict(WRONG="test")
         with self.assertRaises(expected_exception=ValidationError):
@@ -111,6 +129,14 @@ class TestCheckConfiguration(TestCase):
             ),
         )
 
+    def test_load_config_returns_independent_copies(self):
+        config = load_config(filepath_or_keyword="dandi")
+        config["CRITICAL"].append("check_data_orientation")
+
+        self.assertNotIn(
+            member="check_data_orientation", container=load_config(filepath_or_keyword="dandi")["CRITICAL"]
+        )
+
     def test_all_config_check_names_are_in_default_registry(self):
         config = load_config(filepath_or_keyword="dandi")
         for importance_level, check_names in config.items():
@@ -5,7 +5,15 @@ import numpy as np
 import pynwb
 from hdmf.testing import TestCase
 
-from nwbinspector import Importance, InspectorMessage, Severity, organize_messages
+from nwbinspector import (
+    FormatterOptions,
+    Importance,
+    InspectorMessage,
+    MessageFormatter,
+    Severity,
+    organize_messages,
+    save_report,
+)
 from nwbinspector.tools import all_of_type
 
 
@@ -30,6 +38,22 @@ def test_all_of_type():
         assert time_series in nwbfile_time_series
 
 
+def test_all_of_type_with_tuple_of_types():
+    nwbfile = pynwb.NWBFile(
+        session_description="Testing inspector.",
+        identifier=str(uuid4()),
+        session_start_time=datetime.now().astimezone(),
+    )
+    time_series = pynwb.TimeSeries(name="time_series", data=np.zeros(shape=(100, 10)), rate=1.0, unit="")
+    nwbfile.add_acquisition(time_series)
+    processing_module = nwbfile.create_processing_module(name="ecephys", description="")
+
+    nwbfile_objects = list(all_of_type(nwbfile=nwbfile, neurodata_type=(pynwb.TimeSeries, pynwb.base.ProcessingModule)))
+    assert time_series in nwbfile_objects
+    assert processing_module in nwbfile_objects
+    assert nwbfile not in nwbfile_objects
+
+
 class TestOrganization(TestCase):
     @classmethod
     def setUpClass(cls):
@@ -203,3 +227,39 @@ class TestOrganization(TestCase):
             },
         }
         self.assertDictEqual(d1=test_result, d2=true_result)
+
+
+def test_message_formatter_does_not_modify_shared_formatter_options():
+    messages = [InspectorMessage(message="test", file_path="file.nwb")]
+    levels = ["file_path", "importance", "check_function_name", "object_type"]
+    formatter_options = FormatterOptions(section_headers=("=",))
+
+    for _ in range(2):
+        message_formatter = MessageFormatter(messages=messages, levels=levels, formatter_options=formatter_options)
+
+        assert message_formatter.section_headers == ("=", "=", "=", "=")
+    assert formatter_options.section_headers == ("=",)
+
+
+def test_save_report_from_format_messages_iter(tmp_path):
+    messages = [
+        InspectorMessage(message="test1", check_function_name="fun1", object_name="ts1", file_path="file1.nwb"),
+        InspectorMessage(message="test1", check_function_name="fun1", object_name="ts1", file_path="file2.nwb"),
+        InspectorMessage(message="test2", importance=Importance.CRITICAL, object_name="ts2", file_path="file2.nwb"),
+    ]
+    levels = ["importance", "file_path"]
+
+    formatted_messages = MessageFormatter(messages=messages, levels=levels).format_messages()
+    save_report(report_file_path=tmp_path / "from_list.txt", formatted_messages=formatted_messages)
+    formatted_messages_iter = MessageFormatter(messages=messages, levels=levels).format_messages_iter()
+    save_report(report_file_path=tmp_path / "from_iter.txt", formatted_messages=formatted_messages_iter)
+
+    # The timestamp of the report header will differ between the two reports
+    report_from_list = (tmp_path / "from_list.txt").read_text().splitlines()
+    report_from_iter = (tmp_path / "from_iter.txt").read_text().splitlines()
+    assert report_from_iter[:3] == report_from_list[:3]
+    assert report_from_iter[4:] == report_from_list[4:]
+    assert report_from_iter[-3:-1] == [
+        "1.1  file1.nwb and 1 other file: fun1 - 'None' object with name 'ts1'",
+        "       Message: test1",
+    ]
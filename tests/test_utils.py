@@ -1,5 +1,4 @@
-import os
-
+import h5py
 import numpy as np
 import pytest
 from hdmf.testing import TestCase
@@ -7,14 +6,22 @@ from packaging import version
 
 from nwbinspector import Importance
 from nwbinspector.utils import (
+    cache_data_selection,
     calculate_number_of_cpu,
     format_byte_size,
     get_package_version,
     is_ascending_series,
     is_dict_in_string,
     is_regular_series,
+    is_string_json_loadable,
     strtobool,
 )
+from nwbinspector.utils._utils import (
+    _ascending_kernel,
+    _get_available_cpu_count,
+    _has_blosc2_filter,
+    _ScanResistantCache,
+)
 
 
 def test_format_byte_size():
@@ -37,6 +44,42 @@ class TestFormatByteException(TestCase):
 def test_is_regular_series():
     assert is_regular_series(series=[1, 2, 3])
     assert not is_regular_series(series=[1, 2, 4])
+    assert not is_regular_series(series=[1])
+    assert is_regular_series(series=[0.1, 0.2, 0.3000000001], tolerance_decimals=9)
+
+
+def test_is_regular_series_with_nan():  # NaN steps count as a single distinct step
+    assert is_regular_series(series=[0, np.nan, 2])
+    assert is_regular_series(series=[np.nan, np.nan, np.nan])
+    assert not is_regular_series(series=[0, 1, np.nan])
+    assert not is_regular_series(series=[0, 1, 2, np.nan, np.nan])
+
+
+def test_has_blosc2_filter(tmp_path):
+    with h5py.File(name=tmp_path / "test_has_blosc2_filter.h5", mode="w") as file:
+        dataset = file.create_dataset(name="gzip", data=np.arange(10), chunks=(5,), compression="gzip")
+        assert not _has_blosc2_filter(dataset=dataset)
+
+
+def test_is_regular_series_chunked_hdf5_dataset(tmp_path, monkeypatch):
+    monkeypatch.setattr("nwbinspector.utils._utils.CHUNKED_READ_SIZE", 80)  # Ten float64 per block
+    with h5py.File(name=tmp_path / "test_is_regular_series.h5", mode="w") as file:
+        regular = np.arange(100) * 0.1
+        file.create_dataset(name="regular", data=regular, chunks=(10,))
+        irregular_at_block_boundary = regular.copy()
+        irregular_at_block_boundary[50:] += 0.05
+        file.create_dataset(name="irregular", data=irregular_at_block_boundary, chunks=(10,))
+
+        all_nan = np.full(shape=30, fill_value=np.nan)
+        file.create_dataset(name="all_nan", data=all_nan, chunks=(10,))
+        nan_in_later_block = regular.copy()
+        nan_in_later_block[55] = np.nan
+        file.create_dataset(name="nan_in_later_block", data=nan_in_later_block, chunks=(10,))
+
+        assert is_regular_series(series=file["regular"])
+        assert not is_regular_series(series=file["irregular"])
+        assert is_regular_series(series=file["all_nan"])
+        assert not is_regular_series(series=file["nan_in_later_block"])
 
 
 def test_is_dict_in_string_false_1():
@@ -54,6 +97,11 @@ def test_is_dict_in_string_false_3():
     assert is_dict_in_string(string=string) is False
 
 
+def test_is_dict_in_string_false_4():
+    string = "{no colon} and a: colon"
+    assert is_dict_in_string(string=string) is False
+
+
 def test_is_dict_in_string_true_1():
     string = str(dict(a=1))
     assert is_dict_in_string(string=string) is True
@@ -118,12 +166,12 @@ def test_get_package_version_value():
 
 
 class TestCalulcateNumberOfCPU(TestCase):
-    total_cpu = os.cpu_count()
+    total_cpu = _get_available_cpu_count()
 
     def test_request_more_than_available_assert(self):
         requested_cpu = 2500
         with self.assertRaisesWith(
-            exc_type=AssertionError,
+            exc_type=ValueError,
             exc_msg=f"Requested more CPUs ({requested_cpu}) than are available ({self.total_cpu})!",
         ):
             calculate_number_of_cpu(requested_cpu=requested_cpu)
@@ -131,7 +179,7 @@ class TestCalulcateNumberOfCPU(TestCase):
     def test_request_fewer_than_available_assert(self):
         requested_cpu = -2500
         with self.assertRaisesWith(
-            exc_type=AssertionError,
+            exc_type=ValueError,
             exc_msg=f"Requested fewer CPUs ({requested_cpu}) than are available ({self.total_cpu})!",
         ):
             calculate_number_of_cpu(requested_cpu=requested_cpu)
@@ -141,11 +189,69 @@ class TestCalulcateNumberOfCPU(TestCase):
         assert calculate_number_of_cpu(requested_cpu=requested_cpu) == requested_cpu % self.total_cpu
 
 
+def test_cache_data_selection_in_memory():
+    array = np.arange(12).reshape(3, 4)
+    selection = cache_data_selection(data=array, selection=slice(2))
+    np.testing.assert_array_equal(selection, array[:2])
+    assert np.shares_memory(selection, array)  # Not a copy of the full array
+
+    np.testing.assert_array_equal(cache_data_selection(data=[3, 2, 1], selection=slice(2)), [3, 2])
+    np.testing.assert_array_equal(
+        cache_data_selection(data=[[1, 2], [3, 4]], selection=(slice(1), slice(1, 2))), np.array([[2]])
+    )
+
+
+def test_is_string_json_loadable():
+    assert is_string_json_loadable(string=' {"a": 1}')
+    assert is_string_json_loadable(string="NaN")
+    assert not is_string_json_loadable(string="{'a': 1}")
+    assert not is_string_json_loadable(string="a string with {a: 1}")
+    assert not is_string_json_loadable(string="")
+    assert not is_string_json_loadable(string='\x0c{"a": 1}')  # Not whitespace in the JSON grammar
+
+
 def test_is_ascending_series():
     assert is_ascending_series(series=[1, 1, 1])
     assert is_ascending_series(series=[1, 2, 3])
     assert is_ascending_series(series=[1, np.nan, 3])
     assert not is_ascending_series(series=[1, 2, 1])
+    assert not is_ascending_series(series=np.array([2, 1], dtype="uint8"))  # Differences would wrap around
+
+
+def test_ascending_kernel():  # Only compiled when numba is installed, but the logic is the same in pure Python
+    assert _ascending_kernel(array=np.array([1.0, np.nan, 1.0, 3.0]))
+    assert not _ascending_kernel(array=np.array([1.0, np.nan, 0.0]))
+    assert not _ascending_kernel(array=np.array([2, 1], dtype="uint8"))
+
+
+def test_is_ascending_series_with_numba():
+    pytest.importorskip("numba")
+
+    for series in [
+        np.array([1.0, np.nan, 1.0, 3.0]),
+        np.array([1.0, np.nan, 0.0]),
+        np.array([np.nan, np.nan]),
+        np.array([], dtype="float64"),
+        np.arange(10, dtype="int64"),
+        np.array([2, 1], dtype="uint8"),
+    ]:
+        valid_series = series[~np.isnan(series)]
+        assert is_ascending_series(series=series) == bool(np.all(valid_series[1:] >= valid_series[:-1]))
+
+
+def test_is_ascending_series_chunked_hdf5_dataset(tmp_path, monkeypatch):
+    monkeypatch.setattr("nwbinspector.utils._utils.CHUNKED_READ_SIZE", 80)  # Two chunks of ten float32 per block
+    with h5py.File(name=tmp_path / "test_is_ascending_series.h5", mode="w") as file:
+        ascending = np.arange(100, dtype="float32")
+        ascending[15:45] = np.nan  # Spans an entire block
+        file.create_dataset(name="ascending", data=ascending, chunks=(10,))
+        descending_at_block_boundary = np.arange(100, dtype="float32")
+        descending_at_block_boundary[40] = 38
+        file.create_dataset(name="descending", data=descending_at_block_boundary, chunks=(10,))
+
+        assert is_ascending_series(series=file["ascending"])
+        assert not is_ascending_series(series=file["descending"])
+        assert is_ascending_series(series=file["descending"], nelems=40)
 
 
 @pytest.mark.parametrize(
@@ -159,8 +265,54 @@ def test_strtobool(values, target):
     for v in values:
         assert strtobool(v) is target
         assert strtobool(v.upper()) is target
+        assert strtobool(f" {v} ") is target
         with pytest.raises(ValueError):
             strtobool(v + "1")
     # it is strtobool, so no bool is allowed
     with pytest.raises(TypeError):
         strtobool(target)
+
+
+def test_scan_resistant_cache_keeps_repeated_entries_during_scan():
+    cache = _ScanResistantCache(maxsize=8)
+    computed_keys = []
+
+    def get(key):
+        return cache.get_or_compute(key=key, compute=lambda: computed_keys.append(key) or key)
+
+    get("timestamps")
+    get("timestamps")  # Requested twice, so it is protected
+    for index in range(100):  # A long scan of one-off requests
+        get(index)
+    assert get("timestamps") == "timestamps"
+    assert computed_keys.count("timestamps") == 1
+    assert computed_keys.count(99) == 1
+    get(99)
+    assert computed_keys.count(99) == 1  # The most recent one-off request is still cached
+
+
+def test_scan_resistant_cache_demotes_protected_entries():
+    cache = _ScanResistantCache(maxsize=4)  # One probationary and three protected entries
+    computed_keys = []
+
+    def get(key):
+        return cache.get_or_compute(key=key, compute=lambda: computed_keys.append(key) or key)
+
+    for key in ["a", "a", "b", "b", "c", "c", "d", "d"]:  # Protecting "d" pushes "a" out of the protected segment
+        get(key)
+    assert get("a") == "a"
+    assert computed_keys.count("a") == 1  # Demoted rather than dropped
+    assert cache.cache_info().evictions == 0
+
+
+def test_scan_resistant_cache_info():
+    cache = _ScanResistantCache(maxsize=8)
+    for key in ["a", "a", "b", "c", "d"]:
+        cache.get_or_compute(key=key, compute=lambda: None)
+
+    cache_info = cache.cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.evictions) == (1, 4, 1)
+    assert (cache_info.currsize, cache_info.maxsize) == (3, 8)
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 8, 0, 0)